@@ -1,4 +1,101 @@
-from purehash.algorithms._md5 import MD5 as md5
-from purehash.algorithms._sha1 import SHA1 as sha1
-from purehash.algorithms._sha2 import SHA256 as sha256
-from purehash.algorithms._sha2 import SHA512 as sha512
+from __future__ import annotations
+from importlib import import_module
+import os
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from purehash.algorithms._md5 import MD5 as md5, md5_many
+    from purehash.algorithms._sha1 import SHA1 as sha1, sha1_many
+    from purehash.algorithms._sha2 import SHA224 as sha224, sha224_many
+    from purehash.algorithms._sha2 import SHA256 as sha256, sha256_many
+    from purehash.algorithms._sha2 import SHA384 as sha384, sha384_many
+    from purehash.algorithms._sha2 import SHA512 as sha512, sha512_many
+    from purehash.algorithms._sha2 import SHA512_224 as sha512_224, sha512_224_many
+    from purehash.algorithms._sha2 import SHA512_256 as sha512_256, sha512_256_many
+    from purehash.algorithms._sha3 import SHA3_224 as sha3_224, sha3_224_many
+    from purehash.algorithms._sha3 import SHA3_256 as sha3_256, sha3_256_many
+    from purehash.algorithms._sha3 import SHA3_384 as sha3_384, sha3_384_many
+    from purehash.algorithms._sha3 import SHA3_512 as sha3_512, sha3_512_many
+    from purehash.algorithms._sha3 import SHAKE128 as shake_128
+    from purehash.algorithms._sha3 import SHAKE256 as shake_256
+    from purehash._file import file_digest
+    from purehash._multi import MultiHash, multi
+    from purehash._pbkdf2 import pbkdf2_hmac
+    from purehash._registry import algorithms_available, algorithms_guaranteed, new
+    from purehash._instrumentation import (
+        instrumentation_snapshot,
+        is_instrumented,
+        reset_instrumentation,
+        set_instrumentation,
+    )
+
+# Exports are imported on first access (PEP 562), so that importing purehash does
+# not build every algorithm up front.
+_EXPORTS: dict[str, tuple[str, str]] = {
+    "md5": ("purehash.algorithms._md5", "MD5"),
+    "md5_many": ("purehash.algorithms._md5", "md5_many"),
+    "sha1": ("purehash.algorithms._sha1", "SHA1"),
+    "sha1_many": ("purehash.algorithms._sha1", "sha1_many"),
+    "sha224": ("purehash.algorithms._sha2", "SHA224"),
+    "sha224_many": ("purehash.algorithms._sha2", "sha224_many"),
+    "sha256": ("purehash.algorithms._sha2", "SHA256"),
+    "sha256_many": ("purehash.algorithms._sha2", "sha256_many"),
+    "sha384": ("purehash.algorithms._sha2", "SHA384"),
+    "sha384_many": ("purehash.algorithms._sha2", "sha384_many"),
+    "sha512": ("purehash.algorithms._sha2", "SHA512"),
+    "sha512_many": ("purehash.algorithms._sha2", "sha512_many"),
+    "sha512_224": ("purehash.algorithms._sha2", "SHA512_224"),
+    "sha512_224_many": ("purehash.algorithms._sha2", "sha512_224_many"),
+    "sha512_256": ("purehash.algorithms._sha2", "SHA512_256"),
+    "sha512_256_many": ("purehash.algorithms._sha2", "sha512_256_many"),
+    "sha3_224": ("purehash.algorithms._sha3", "SHA3_224"),
+    "sha3_224_many": ("purehash.algorithms._sha3", "sha3_224_many"),
+    "sha3_256": ("purehash.algorithms._sha3", "SHA3_256"),
+    "sha3_256_many": ("purehash.algorithms._sha3", "sha3_256_many"),
+    "sha3_384": ("purehash.algorithms._sha3", "SHA3_384"),
+    "sha3_384_many": ("purehash.algorithms._sha3", "sha3_384_many"),
+    "sha3_512": ("purehash.algorithms._sha3", "SHA3_512"),
+    "sha3_512_many": ("purehash.algorithms._sha3", "sha3_512_many"),
+    "shake_128": ("purehash.algorithms._sha3", "SHAKE128"),
+    "shake_256": ("purehash.algorithms._sha3", "SHAKE256"),
+    "file_digest": ("purehash._file", "file_digest"),
+    "MultiHash": ("purehash._multi", "MultiHash"),
+    "multi": ("purehash._multi", "multi"),
+    "pbkdf2_hmac": ("purehash._pbkdf2", "pbkdf2_hmac"),
+    "algorithms_available": ("purehash._registry", "algorithms_available"),
+    "algorithms_guaranteed": ("purehash._registry", "algorithms_guaranteed"),
+    "new": ("purehash._registry", "new"),
+    "instrumentation_snapshot": (
+        "purehash._instrumentation",
+        "instrumentation_snapshot",
+    ),
+    "is_instrumented": ("purehash._instrumentation", "is_instrumented"),
+    "reset_instrumentation": ("purehash._instrumentation", "reset_instrumentation"),
+    "set_instrumentation": ("purehash._instrumentation", "set_instrumentation"),
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module: str
+        attribute: str
+        module, attribute = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value: Any = getattr(import_module(module), attribute)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+# The environment variable must take effect even if instrumentation is never
+# imported explicitly.
+if os.environ.get("PUREHASH_INSTRUMENTATION", "") not in ("", "0"):
+    import_module("purehash._instrumentation")
@@ -0,0 +1,5 @@
+import sys
+
+from purehash.cli import main
+
+sys.exit(main())
@@ -0,0 +1,27 @@
+from __future__ import annotations
+from typing import Any, Callable
+
+# Generated expressions are left unmasked wherever possible. Addition and the
+# bitwise operators only propagate garbage upwards, so a single mask before a
+# value is stored (or right shifted) keeps every variable within its word size.
+
+
+def mask(bits: int) -> str:
+    return hex((1 << bits) - 1)
+
+
+def rotate_left(expression: str, rotation: int, bits: int) -> str:
+    return f"({expression} << {rotation} | {expression} >> {bits - rotation})"
+
+
+def rotate_right(expression: str, rotation: int, bits: int) -> str:
+    return f"({expression} >> {rotation} | {expression} << {bits - rotation})"
+
+
+def compile_function(
+    name: str, lines: list[str], namespace: dict[str, Any]
+) -> Callable[..., Any]:
+    namespace = dict(namespace)
+    exec(compile("\n".join(lines), f"<purehash {name}>", "exec"), namespace)
+
+    return namespace[name]
@@ -1,18 +1,226 @@
+from __future__ import annotations
+from typing import Any, Callable, Iterable, Optional, TypeVar, Union
+
+from purehash._lanes import LANE_THRESHOLD, hash_lanes, lanes_available
+from purehash._util import ReadableBuffer, get_struct, pack, padding_fills, unpack
+
+HashType = TypeVar("HashType", bound="Hash")
+
+
 class Hash:
+    __slots__ = ("_state", "_blocks_processed", "_buffer", "_digest")
+
+    # hashlib-style metadata. digest_size and block_size mirror the private
+    # parameters below, which are filled in by __init_subclass__.
+    name: str
+    digest_size: int
+    block_size: int
+
+    _block_size: int
+    _word_size: int
+    _digest_size: int
+    _little_endian: bool
+    _initial_state: tuple[int, ...]
+    _compress: Callable[[tuple[int, ...], ReadableBuffer], tuple[int, ...]]
+    _compress_lanes: Callable[[list[Any], Any], list[Any]]
+
+    # Extendable output functions take an output length in digest().
+    _extendable_output: bool = False
+
+    _state: tuple[int, ...]
     _blocks_processed: int
     _buffer: bytearray
+    _digest: Optional[bytes]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
 
-    def __init__(self, message: bytes = b"") -> None:
+        # Intermediate bases may leave the parameters to their subclasses.
+        if hasattr(cls, "_digest_size"):
+            cls.digest_size = cls._digest_size
+            cls.block_size = cls._block_size
+
+    def __init__(self, message: ReadableBuffer = b"") -> None:
+        self._state = self._initial_state
         self._blocks_processed = 0
         self._buffer = bytearray()
+        self._digest = None
 
         self.update(message)
 
-    def update(self, message: bytes) -> None:
-        pass
+    def _process_block(self, block: ReadableBuffer) -> None:
+        self._state = self._compress(self._state, block)
+
+    def update(self, message: ReadableBuffer) -> None:
+        block_size: int = self._block_size
+        view: memoryview = memoryview(message).cast("B")
+        offset: int = 0
+
+        if view:
+            self._digest = None
+
+        # Top up any partial block left over from the previous call.
+        if self._buffer:
+            offset = block_size - len(self._buffer)
+            self._buffer += view[:offset]
+
+            if len(self._buffer) < block_size:
+                return
+
+            self._process_block(self._buffer)
+            self._blocks_processed += 1
+            self._buffer = bytearray()
+
+        # Consume whole blocks in place, only copying the trailing partial block.
+        end: int = len(view) - ((len(view) - offset) % block_size)
+        self._blocks_processed += (end - offset) // block_size
+
+        i: int
+        for i in range(offset, end, block_size):
+            self._process_block(view[i : i + block_size])
+
+        self._buffer += view[end:]
+
+    @classmethod
+    def _padding(cls, length: int) -> bytes:
+        # Appended to a message of length bytes: the 0x80 marker, zero fill and the
+        # length in bits (Merkle-Damgard strengthening).
+        block_size: int = cls._block_size
+
+        return padding_fills(block_size)[length % block_size] + pack(
+            block_size // 8, cls._little_endian, length * 8
+        )
 
     def digest(self) -> bytes:
-        pass
+        # The digest is cached until the next update() with a non-empty message.
+        if self._digest is None:
+            block_size: int = self._block_size
+
+            # Compress the padded tail into a local, leaving the object untouched.
+            tail: bytearray = self._buffer + self._padding(
+                self._blocks_processed * block_size + len(self._buffer)
+            )
+
+            state: tuple[int, ...] = self._state
+            i: int
+            for i in range(0, len(tail), block_size):
+                state = self._compress(state, tail[i : i + block_size])
+
+            self._digest = pack(self._word_size, self._little_endian, *state)[
+                : self._digest_size
+            ]
+
+        return self._digest
 
     def hexdigest(self) -> str:
         return self.digest().hex()
+
+    def copy(self: HashType) -> HashType:
+        copy_: HashType = type(self).__new__(type(self))
+        copy_._state = self._state
+        copy_._blocks_processed = self._blocks_processed
+        copy_._buffer = bytearray(self._buffer)
+        copy_._digest = self._digest
+
+        return copy_
+
+    def get_state(self) -> bytes:
+        # Chaining values, then the number of blocks processed, then the buffer.
+        return (
+            pack(self._word_size, self._little_endian, *self._state)
+            + pack(8, False, self._blocks_processed)
+            + self._buffer
+        )
+
+    @classmethod
+    def from_state(cls: type[HashType], state: ReadableBuffer) -> HashType:
+        state_size: int = len(cls._initial_state) * cls._word_size
+        # State usually comes from outside the process, so is checked even under -O.
+        if not state_size + 8 <= len(state) < state_size + 8 + cls._block_size:
+            raise ValueError("Invalid state.")
+
+        hash_: HashType = cls.__new__(cls)
+        hash_._state = unpack(cls._word_size, cls._little_endian, state[:state_size])
+        (hash_._blocks_processed,) = unpack(8, False, state[state_size:][:8])
+        hash_._buffer = bytearray(state[state_size + 8 :])
+        hash_._digest = None
+
+        return hash_
+
+    def get_chaining_values(self) -> tuple[bytes, int]:
+        # The packed chaining values and the number of bytes they cover, which is
+        # always block aligned. Buffered bytes past that point are not included.
+        return (
+            pack(self._word_size, self._little_endian, *self._state),
+            self._blocks_processed * self._block_size,
+        )
+
+    @classmethod
+    def from_chaining_values(
+        cls: type[HashType],
+        values: Union[ReadableBuffer, Iterable[int]],
+        byte_count: int,
+    ) -> HashType:
+        # Resume hashing at a block aligned offset, given the chaining values after
+        # byte_count bytes. Only the data from byte_count onwards is needed.
+        if byte_count < 0 or byte_count % cls._block_size:
+            raise ValueError(
+                "byte_count must be a non-negative multiple of the block size."
+            )
+
+        state: tuple[int, ...]
+        if isinstance(values, (bytes, bytearray, memoryview)):
+            if len(values) != len(cls._initial_state) * cls._word_size:
+                raise ValueError("Invalid chaining values.")
+
+            state = unpack(cls._word_size, cls._little_endian, values)
+        else:
+            state = tuple(values)
+            if len(state) != len(cls._initial_state) or not all(
+                0 <= value < 1 << (cls._word_size * 8) for value in state
+            ):
+                raise ValueError("Invalid chaining values.")
+
+        hash_: HashType = cls.__new__(cls)
+        hash_._state = state
+        hash_._blocks_processed = byte_count // cls._block_size
+        hash_._buffer = bytearray()
+        hash_._digest = None
+
+        return hash_
+
+
+def hash_many(algorithm: type[Hash], messages: Iterable[ReadableBuffer]) -> list[bytes]:
+    block_size: int = algorithm._block_size
+    digest_size: int = algorithm._digest_size
+    compress: Callable[..., tuple[int, ...]] = algorithm._compress
+    padding: Callable[[int], bytes] = algorithm._padding
+    initial_state: tuple[int, ...] = algorithm._initial_state
+    pack_state: Callable[..., bytes] = get_struct(
+        algorithm._word_size, algorithm._little_endian, len(initial_state)
+    ).pack
+
+    messages_: list[bytes] = [bytes(message) for message in messages]
+
+    # Batches of equal length messages can be hashed across NumPy lanes.
+    if (
+        len(messages_) >= LANE_THRESHOLD
+        and len({len(message) for message in messages_}) == 1
+        and lanes_available()
+    ):
+        return hash_lanes(algorithm, messages_)
+
+    results: list[bytes] = []
+
+    message: bytes
+    for message in messages_:
+        padded: bytes = message + padding(len(message))
+
+        state: tuple[int, ...] = initial_state
+        i: int
+        for i in range(0, len(padded), block_size):
+            state = compress(state, padded[i : i + block_size])
+
+        results.append(pack_state(*state)[:digest_size])
+
+    return results
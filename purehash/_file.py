@@ -0,0 +1,81 @@
+from __future__ import annotations
+import mmap
+import os
+import stat
+from typing import BinaryIO, Optional, Union
+
+from purehash._common import Hash
+from purehash._registry import lookup
+
+DEFAULT_CHUNK_SIZE: int = 2**18
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+def _fileno(file: BinaryIO) -> Optional[int]:
+    try:
+        return file.fileno()
+    except (AttributeError, OSError):
+        return None
+
+
+def _digest_mmap(file: BinaryIO, hash_: Hash) -> bool:
+    fileno: Optional[int] = _fileno(file)
+    if fileno is None:
+        return False
+
+    status: os.stat_result = os.fstat(fileno)
+    if not stat.S_ISREG(status.st_mode):
+        return False
+
+    # Empty files cannot be mapped. Some, such as those in procfs, report a size of
+    # zero but still have content, so they are left for readinto to drain.
+    position: int = file.tell()
+    if status.st_size <= position:
+        return False
+
+    # Some regular files cannot be mapped at all, such as those in sysfs.
+    mapped: mmap.mmap
+    try:
+        mapped = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return False
+
+    with mapped:
+        with memoryview(mapped) as view:
+            hash_.update(view[position:])
+
+    file.seek(status.st_size)
+
+    return True
+
+
+def _digest_readinto(file: BinaryIO, hash_: Hash, chunk_size: int) -> None:
+    chunk: bytearray = bytearray(chunk_size)
+    view: memoryview = memoryview(chunk)
+
+    while True:
+        length: Optional[int] = file.readinto(chunk)  # type: ignore[attr-defined]
+        if not length:
+            break
+
+        hash_.update(view[:length])
+
+
+def file_digest(
+    file: Union[PathLike, BinaryIO],
+    algorithm: Union[str, type[Hash]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Hash:
+    assert chunk_size > 0, "chunk_size must be positive."
+
+    hash_: Hash = lookup(algorithm)()
+
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb") as file_:
+            if not _digest_mmap(file_, hash_):
+                _digest_readinto(file_, hash_, chunk_size)
+    elif not _digest_mmap(file, hash_):
+        _digest_readinto(file, hash_, chunk_size)
+
+    return hash_
@@ -0,0 +1,128 @@
+from __future__ import annotations
+import copy
+import os
+from time import perf_counter
+from typing import Any, Callable
+
+from purehash._common import Hash
+from purehash._registry import ALGORITHMS, lookup
+from purehash._util import ReadableBuffer
+
+ENVIRONMENT_VARIABLE: str = "PUREHASH_INSTRUMENTATION"
+
+# Methods are only swapped for counting wrappers while instrumentation is enabled,
+# so there is no cost at all when it is disabled.
+_MISSING: Any = object()
+_originals: dict[tuple[type[Hash], str], Any] = {}
+_counters: dict[str, dict[str, Any]] = {}
+
+
+def _new_counters() -> dict[str, Any]:
+    return {
+        "blocks": 0,
+        "bytes": 0,
+        "digests": 0,
+        "time": {"compress": 0.0, "update": 0.0, "digest": 0.0},
+    }
+
+
+def _wrap_compress(
+    counters: dict[str, Any], compress: Callable[..., tuple[int, ...]]
+) -> Callable[..., tuple[int, ...]]:
+    def wrapper(state: tuple[int, ...], block: ReadableBuffer) -> tuple[int, ...]:
+        start: float = perf_counter()
+        try:
+            return compress(state, block)
+        finally:
+            counters["time"]["compress"] += perf_counter() - start
+            counters["blocks"] += 1
+
+    return wrapper
+
+
+def _wrap_update(
+    counters: dict[str, Any], update: Callable[[Hash, ReadableBuffer], None]
+) -> Callable[[Hash, ReadableBuffer], None]:
+    def wrapper(self: Hash, message: ReadableBuffer) -> None:
+        start: float = perf_counter()
+        try:
+            update(self, message)
+        finally:
+            counters["time"]["update"] += perf_counter() - start
+            counters["bytes"] += memoryview(message).nbytes
+
+    return wrapper
+
+
+def _wrap_digest(
+    counters: dict[str, Any], digest: Callable[..., bytes]
+) -> Callable[..., bytes]:
+    # Extendable output functions take the output length as an argument.
+    def wrapper(self: Hash, *args: Any) -> bytes:
+        start: float = perf_counter()
+        try:
+            return digest(self, *args)
+        finally:
+            counters["time"]["digest"] += perf_counter() - start
+            counters["digests"] += 1
+
+    return wrapper
+
+
+def _patch(algorithm: type[Hash], name: str, value: Any) -> None:
+    _originals[(algorithm, name)] = algorithm.__dict__.get(name, _MISSING)
+    setattr(algorithm, name, value)
+
+
+def set_instrumentation(enabled: bool) -> None:
+    if enabled == bool(_originals):
+        return
+
+    algorithm: type[Hash]
+    if not enabled:
+        name: str
+        original: Any
+        for (algorithm, name), original in _originals.items():
+            if original is _MISSING:
+                delattr(algorithm, name)
+            else:
+                setattr(algorithm, name, original)
+
+        _originals.clear()
+        return
+
+    for name in ALGORITHMS:
+        algorithm = lookup(name)
+        counters: dict[str, Any] = _counters.setdefault(name, _new_counters())
+
+        _patch(
+            algorithm,
+            "_compress",
+            staticmethod(_wrap_compress(counters, algorithm._compress)),
+        )
+        _patch(algorithm, "update", _wrap_update(counters, algorithm.update))
+        _patch(algorithm, "digest", _wrap_digest(counters, algorithm.digest))
+
+
+def is_instrumented() -> bool:
+    return bool(_originals)
+
+
+def instrumentation_snapshot() -> dict[str, dict[str, Any]]:
+    # Per algorithm: blocks compressed, bytes passed to update(), digest() calls
+    # and cumulative seconds per stage. Stages nest, so compress time is also
+    # counted within the update and digest calls that triggered it.
+    return copy.deepcopy(_counters)
+
+
+def reset_instrumentation() -> None:
+    _counters.clear()
+
+    # Wrappers hold a reference to their counters, so re-create them.
+    if _originals:
+        set_instrumentation(False)
+        set_instrumentation(True)
+
+
+if os.environ.get(ENVIRONMENT_VARIABLE, "") not in ("", "0"):
+    set_instrumentation(True)
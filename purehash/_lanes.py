@@ -0,0 +1,60 @@
+from __future__ import annotations
+from functools import lru_cache
+from typing import Any
+
+# NumPy takes longer to import than the rest of purehash put together, so it is
+# only imported once a batch is large enough to use it.
+numpy: Any = None
+
+# Below this many messages the per-operation overhead of NumPy outweighs the
+# per-lane saving, so the scalar path is faster.
+LANE_THRESHOLD: int = 64
+
+
+@lru_cache(maxsize=None)
+def lanes_available() -> bool:
+    global numpy
+
+    try:
+        import numpy as numpy_
+    except ImportError:  # pragma: no cover
+        return False
+
+    numpy = numpy_
+    return True
+
+
+def hash_lanes(algorithm: Any, messages: list[bytes]) -> list[bytes]:
+    assert lanes_available(), "The lane engine requires NumPy."
+    assert len({len(message) for message in messages}) == 1, "Lengths must match."
+
+    block_size: int = algorithm._block_size
+    word_size: int = algorithm._word_size
+    little_endian: bool = algorithm._little_endian
+    initial_state: tuple[int, ...] = algorithm._initial_state
+
+    dtype: Any = numpy.dtype(f"{'<' if little_endian else '>'}u{word_size}")
+    lane_dtype: Any = dtype.newbyteorder("=")
+
+    # Every message has the same length, and therefore the same padding.
+    tail: bytes = algorithm._padding(len(messages[0]))
+    words: Any = (
+        numpy.frombuffer(b"".join(message + tail for message in messages), dtype)
+        .astype(lane_dtype)
+        .reshape(len(messages), -1, block_size // word_size)
+    )
+
+    # One array per chaining value, holding that value for every lane.
+    state: list[Any] = [
+        numpy.full(len(messages), value, lane_dtype) for value in initial_state
+    ]
+
+    i: int
+    for i in range(words.shape[1]):
+        state = algorithm._compress_lanes(state, words[:, i])
+
+    digest_size: int = algorithm._digest_size
+    state_size: int = len(initial_state) * word_size
+    digests: bytes = numpy.stack(state, axis=1).astype(dtype).tobytes()
+
+    return [digests[i : i + digest_size] for i in range(0, len(digests), state_size)]
@@ -0,0 +1,141 @@
+from __future__ import annotations
+from typing import Callable, Iterable, Union
+
+from purehash._common import Hash
+from purehash._registry import lookup, name_of
+from purehash._util import ReadableBuffer
+
+
+class _Group:
+    # Algorithms with the same block size share one buffer and block count, so each
+    # block is sliced once and handed to every compression function in turn.
+    __slots__ = ("algorithms", "states", "blocks_processed", "buffer")
+
+    algorithms: list[type[Hash]]
+    states: list[tuple[int, ...]]
+    blocks_processed: int
+    buffer: bytearray
+
+    def __init__(self, algorithms: list[type[Hash]]) -> None:
+        self.algorithms = algorithms
+        self.states = [algorithm._initial_state for algorithm in algorithms]
+        self.blocks_processed = 0
+        self.buffer = bytearray()
+
+    def update(self, view: memoryview) -> None:
+        block_size: int = self.algorithms[0]._block_size
+        compresses: list[Callable[..., tuple[int, ...]]] = [
+            algorithm._compress for algorithm in self.algorithms
+        ]
+        states: list[tuple[int, ...]] = self.states
+        offset: int = 0
+
+        if self.buffer:
+            offset = block_size - len(self.buffer)
+            self.buffer += view[:offset]
+
+            if len(self.buffer) < block_size:
+                return
+
+            states = [
+                compress(state, self.buffer)
+                for compress, state in zip(compresses, states)
+            ]
+            self.blocks_processed += 1
+            self.buffer = bytearray()
+
+        end: int = len(view) - ((len(view) - offset) % block_size)
+        self.blocks_processed += (end - offset) // block_size
+
+        i: int
+        for i in range(offset, end, block_size):
+            block: memoryview = view[i : i + block_size]
+            states = [
+                compress(state, block) for compress, state in zip(compresses, states)
+            ]
+
+        self.states = states
+        self.buffer += view[end:]
+
+    def copy(self) -> _Group:
+        copy_: _Group = _Group(self.algorithms)
+        copy_.states = list(self.states)
+        copy_.blocks_processed = self.blocks_processed
+        copy_.buffer = bytearray(self.buffer)
+
+        return copy_
+
+    def hashes(self) -> Iterable[Hash]:
+        algorithm: type[Hash]
+        state: tuple[int, ...]
+        for algorithm, state in zip(self.algorithms, self.states):
+            hash_: Hash = algorithm.__new__(algorithm)
+            hash_._state = state
+            hash_._blocks_processed = self.blocks_processed
+            hash_._buffer = self.buffer
+            hash_._digest = None
+
+            yield hash_
+
+
+class MultiHash:
+    __slots__ = ("_names", "_groups")
+
+    _names: list[str]
+    _groups: list[_Group]
+
+    def __init__(
+        self,
+        algorithms: Iterable[Union[str, type[Hash]]],
+        message: ReadableBuffer = b"",
+    ) -> None:
+        algorithms_: list[type[Hash]] = list(
+            dict.fromkeys(
+                lookup(algorithm, fixed_size=True) for algorithm in algorithms
+            )
+        )
+        assert algorithms_, "At least one algorithm is required."
+
+        groups: dict[int, list[type[Hash]]] = {}
+
+        algorithm: type[Hash]
+        for algorithm in algorithms_:
+            groups.setdefault(algorithm._block_size, []).append(algorithm)
+
+        self._groups = [_Group(group) for group in groups.values()]
+        self._names = [name_of(algorithm) for algorithm in algorithms_]
+
+        self.update(message)
+
+    def update(self, message: ReadableBuffer) -> None:
+        view: memoryview = memoryview(message).cast("B")
+
+        group: _Group
+        for group in self._groups:
+            group.update(view)
+
+    def digest(self) -> dict[str, bytes]:
+        # Finalises throwaway Hash objects, so the running state is left untouched.
+        digests: dict[str, bytes] = {
+            name_of(type(hash_)): hash_.digest()
+            for group in self._groups
+            for hash_ in group.hashes()
+        }
+
+        return {name: digests[name] for name in self._names}
+
+    def hexdigest(self) -> dict[str, str]:
+        return {name: digest.hex() for name, digest in self.digest().items()}
+
+    def copy(self) -> MultiHash:
+        copy_: MultiHash = MultiHash.__new__(MultiHash)
+        copy_._names = self._names
+        copy_._groups = [group.copy() for group in self._groups]
+
+        return copy_
+
+
+def multi(
+    algorithms: Iterable[Union[str, type[Hash]]], message: ReadableBuffer = b""
+) -> MultiHash:
+    return MultiHash(algorithms, message)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Callable, Optional, Union
+
+from purehash._common import Hash
+from purehash._registry import lookup
+from purehash._util import ReadableBuffer, get_struct, pack
+from purehash.hmac import _compute_midstates
+
+
+def _pbkdf2_block(
+    algorithm: type[Hash], password: bytes, salt: bytes, iterations: int, index: int
+) -> bytes:
+    inner: Hash
+    outer: Hash
+    # Not taken from the HMAC cache, which would keep every password in memory, and
+    # saves only two compressions per output block.
+    inner, outer = _compute_midstates(algorithm, password)
+
+    block_size: int = algorithm._block_size
+    compress: Callable[..., tuple[int, ...]] = algorithm._compress
+    pack_state: Callable[..., bytes] = get_struct(
+        algorithm._word_size, algorithm._little_endian, len(algorithm._initial_state)
+    ).pack
+
+    # The first iteration goes through the usual HMAC path.
+    digest_size: int = algorithm._digest_size
+    u: bytes = _hmac(inner, outer, salt + pack(4, False, index))
+    result: int = int.from_bytes(u, "big")
+
+    # Every later HMAC message is exactly one digest long, following one block of
+    # padded key. Both compressions therefore take a single block with the same
+    # padding, so the midstates can be compressed directly.
+    tail: bytes = algorithm._padding(block_size + digest_size)
+    inner_state: tuple[int, ...] = inner._state
+    outer_state: tuple[int, ...] = outer._state
+
+    for _ in range(iterations - 1):
+        u = pack_state(*compress(inner_state, u + tail))[:digest_size]
+        u = pack_state(*compress(outer_state, u + tail))[:digest_size]
+        result ^= int.from_bytes(u, "big")
+
+    return result.to_bytes(digest_size, "big")
+
+
+def _hmac(inner: Hash, outer: Hash, message: bytes) -> bytes:
+    inner = inner.copy()
+    inner.update(message)
+
+    outer = outer.copy()
+    outer.update(inner.digest())
+
+    return outer.digest()
+
+
+def pbkdf2_hmac(
+    hash_name: Union[str, type[Hash]],
+    password: ReadableBuffer,
+    salt: ReadableBuffer,
+    iterations: int,
+    dklen: Optional[int] = None,
+    workers: int = 1,
+) -> bytes:
+    algorithm: type[Hash] = lookup(hash_name, fixed_size=True)
+    digest_size: int = algorithm._digest_size
+
+    if iterations < 1:
+        raise ValueError("iterations must be at least 1.")
+
+    if dklen is None:
+        dklen = digest_size
+    elif dklen < 1:
+        raise ValueError("dklen must be at least 1.")
+
+    # Output blocks are independent of each other, so can be derived in parallel.
+    indices: range = range(1, -(-dklen // digest_size) + 1)
+    arguments: tuple[repeat, ...] = (
+        repeat(algorithm),
+        repeat(bytes(password)),
+        repeat(bytes(salt)),
+        repeat(iterations),
+    )
+
+    derived: bytes
+    if workers > 1 and len(indices) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(indices))) as executor:
+            derived = b"".join(executor.map(_pbkdf2_block, *arguments, indices))
+    else:
+        derived = b"".join(map(_pbkdf2_block, *arguments, indices))
+
+    return derived[:dklen]
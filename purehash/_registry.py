@@ -0,0 +1,66 @@
+from __future__ import annotations
+from importlib import import_module
+from typing import Union
+
+from purehash._common import Hash
+from purehash._util import ReadableBuffer
+
+# Algorithm modules are only imported when first looked up, so a process pays for
+# building the constants and compression functions of the algorithms it uses.
+ALGORITHMS: dict[str, tuple[str, str]] = {
+    "md5": ("purehash.algorithms._md5", "MD5"),
+    "sha1": ("purehash.algorithms._sha1", "SHA1"),
+    "sha224": ("purehash.algorithms._sha2", "SHA224"),
+    "sha256": ("purehash.algorithms._sha2", "SHA256"),
+    "sha384": ("purehash.algorithms._sha2", "SHA384"),
+    "sha512": ("purehash.algorithms._sha2", "SHA512"),
+    "sha512_224": ("purehash.algorithms._sha2", "SHA512_224"),
+    "sha512_256": ("purehash.algorithms._sha2", "SHA512_256"),
+    "sha3_224": ("purehash.algorithms._sha3", "SHA3_224"),
+    "sha3_256": ("purehash.algorithms._sha3", "SHA3_256"),
+    "sha3_384": ("purehash.algorithms._sha3", "SHA3_384"),
+    "sha3_512": ("purehash.algorithms._sha3", "SHA3_512"),
+    "shake_128": ("purehash.algorithms._sha3", "SHAKE128"),
+    "shake_256": ("purehash.algorithms._sha3", "SHAKE256"),
+}
+
+algorithms_guaranteed: frozenset[str] = frozenset(ALGORITHMS)
+algorithms_available: frozenset[str] = algorithms_guaranteed
+
+
+def lookup(algorithm: Union[str, type[Hash]], fixed_size: bool = False) -> type[Hash]:
+    # fixed_size rejects extendable output functions, for callers that need
+    # digest() to work without an output length.
+    algorithm_: type[Hash]
+    if isinstance(algorithm, str):
+        try:
+            module: str
+            class_name: str
+            module, class_name = ALGORITHMS[algorithm.lower()]
+        except KeyError:
+            raise ValueError(f"Unsupported hash algorithm: {algorithm}") from None
+
+        algorithm_ = getattr(import_module(module), class_name)
+    else:
+        algorithm_ = algorithm
+
+    if fixed_size and algorithm_._extendable_output:
+        raise ValueError(
+            f"Extendable output functions are not supported here: {algorithm}"
+        )
+
+    return algorithm_
+
+
+def name_of(algorithm: Union[str, type[Hash]]) -> str:
+    algorithm = lookup(algorithm)
+
+    name: str = getattr(algorithm, "name", "")
+    if name in ALGORITHMS and lookup(name) is algorithm:
+        return name
+
+    raise ValueError(f"Unregistered hash algorithm: {algorithm}")
+
+
+def new(name: Union[str, type[Hash]], data: ReadableBuffer = b"") -> Hash:
+    return lookup(name)(data)
@@ -1,19 +1,15 @@
 from __future__ import annotations
+from functools import lru_cache
 from random import choice, getrandbits
-from typing import Any
+from struct import Struct
+from typing import Any, Callable, Union
 
+ReadableBuffer = Union[bytes, bytearray, memoryview]
 
-def left_rotate(number: int, rotation: int, bits: int) -> int:
-    rotation = rotation % bits
-    return ((number << rotation) % (2**bits)) | (number >> (bits - rotation))
+STRUCT_FORMATS: dict[int, str] = {1: "B", 2: "H", 4: "I", 8: "Q"}
 
 
-def right_rotate(number: int, rotation: int, bits: int) -> int:
-    rotation = rotation % bits
-    return left_rotate(number, bits - rotation, bits)
-
-
-def pack(size: int, little_endian: bool, *args: int) -> bytes:
+def pack_pure(size: int, little_endian: bool, *args: int) -> bytes:
     result: bytearray = bytearray()
 
     number: int
@@ -32,7 +28,9 @@ def pack(size: int, little_endian: bool, *args: int) -> bytes:
     return bytes(result)
 
 
-def unpack(size: int, little_endian: bool, bytes_: bytes) -> tuple[int, ...]:
+def unpack_pure(
+    size: int, little_endian: bool, bytes_: ReadableBuffer
+) -> tuple[int, ...]:
     assert len(bytes_) % size == 0, "Length of bytes_ must be a multiple of size."
 
     result: list[int] = []
@@ -57,20 +55,47 @@ def unpack(size: int, little_endian: bool, bytes_: bytes) -> tuple[int, ...]:
     return tuple(result)
 
 
-def padding(
-    length: int, block_size: int, length_size: int, length_little_endian: bool
-) -> bytes:
-    padding_: bytearray = bytearray(b"\x80")
+@lru_cache(maxsize=None)
+def get_struct(size: int, little_endian: bool, count: int) -> Struct:
+    return Struct(f"{'<' if little_endian else '>'}{count}{STRUCT_FORMATS[size]}")
+
+
+def pack(size: int, little_endian: bool, *args: int) -> bytes:
+    if size in STRUCT_FORMATS:
+        return get_struct(size, little_endian, len(args)).pack(*args)
+
+    # Sizes struct has no format for, such as the 128-bit SHA-512 length field.
+    return b"".join(
+        number.to_bytes(size, "little" if little_endian else "big") for number in args
+    )
+
+
+def unpack(size: int, little_endian: bool, bytes_: ReadableBuffer) -> tuple[int, ...]:
+    assert len(bytes_) % size == 0, "Length of bytes_ must be a multiple of size."
+
+    if size in STRUCT_FORMATS:
+        return get_struct(size, little_endian, len(bytes_) // size).unpack(bytes_)
+
+    return tuple(
+        int.from_bytes(bytes_[i : i + size], "little" if little_endian else "big")
+        for i in range(0, len(bytes_), size)
+    )
+
 
-    length_mod: int = length % block_size
-    if length_mod < (block_size - (block_size // 8)):
-        padding_ += b"\x00" * (block_size - (block_size // 8) - 1 - length_mod)
-    else:
-        padding_ += b"\x00" * (block_size * 2 - (block_size // 8) - 1 - length_mod)
+BACKENDS: dict[str, tuple[Callable[..., bytes], Callable[..., tuple[int, ...]]]] = {
+    "pure": (pack_pure, unpack_pure),
+    "struct": (pack, unpack),
+}
 
-    padding_ += pack(length_size, length_little_endian, length * 8)
 
-    return bytes(padding_)
+@lru_cache(maxsize=None)
+def padding_fills(block_size: int) -> tuple[bytes, ...]:
+    # The 0x80 marker and zero fill for every possible final block length, ahead
+    # of a length field of block_size // 8 bytes.
+    return tuple(
+        b"\x80" + bytes((block_size - (block_size // 8) - 1 - i) % block_size)
+        for i in range(block_size)
+    )
 
 
 def random_tests(x: Any, y: Any, problem_lengths: tuple[int, ...]) -> None:
@@ -0,0 +1,109 @@
+from __future__ import annotations
+import asyncio
+from concurrent.futures import Executor
+from typing import AsyncIterable, Optional, Union
+
+from purehash._common import Hash
+from purehash._registry import lookup
+from purehash._util import ReadableBuffer
+
+DEFAULT_CHUNK_SIZE: int = 2**16
+DEFAULT_MAX_IN_FLIGHT: int = 4
+DEFAULT_BLOCK_BUDGET: int = 256
+
+
+class AsyncHasher:
+    _hash: Hash
+    _executor: Optional[Executor]
+    _max_in_flight: int
+    _slice_size: int
+    _slots: Optional[asyncio.Semaphore]
+    _tail: Optional[asyncio.Future[None]]
+
+    def __init__(
+        self,
+        algorithm: Union[str, type[Hash]] = "sha256",
+        executor: Optional[Executor] = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        block_budget: int = DEFAULT_BLOCK_BUDGET,
+    ) -> None:
+        assert max_in_flight > 0, "max_in_flight must be positive."
+        assert block_budget > 0, "block_budget must be positive."
+
+        self._hash = lookup(algorithm, fixed_size=True)()
+        self._executor = executor
+        self._max_in_flight = max_in_flight
+        self._slice_size = block_budget * self._hash._block_size
+
+        # Created on first use, so that it belongs to the running loop.
+        self._slots = None
+        self._tail = None
+
+    async def _compress(
+        self, previous: Optional[asyncio.Future[None]], slice_: ReadableBuffer
+    ) -> None:
+        assert self._slots is not None
+
+        try:
+            # Slices must be applied in order, whichever executor thread runs them.
+            if previous is not None:
+                await previous
+
+            await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._hash.update, slice_
+            )
+        finally:
+            self._slots.release()
+
+    async def update(self, data: ReadableBuffer) -> None:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self._max_in_flight)
+
+        # Compression happens later, so take a copy unless data is immutable.
+        view: memoryview = memoryview(data if isinstance(data, bytes) else bytes(data))
+
+        # Each slice is at most block_budget blocks, and waiting for a free slot
+        # both bounds memory and hands control back to the loop between slices.
+        i: int
+        for i in range(0, len(view), self._slice_size):
+            await self._slots.acquire()
+            self._tail = asyncio.ensure_future(
+                self._compress(self._tail, view[i : i + self._slice_size])
+            )
+
+    async def result(self) -> Hash:
+        if self._tail is not None:
+            await self._tail
+
+        return self._hash
+
+    async def digest(self) -> bytes:
+        return (await self.result()).digest()
+
+    async def hexdigest(self) -> str:
+        return (await self.result()).hexdigest()
+
+
+async def hash_stream(
+    reader: Union[asyncio.StreamReader, AsyncIterable[ReadableBuffer]],
+    algorithm: Union[str, type[Hash]] = "sha256",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    block_budget: int = DEFAULT_BLOCK_BUDGET,
+) -> Hash:
+    hasher: AsyncHasher = AsyncHasher(algorithm, executor, max_in_flight, block_budget)
+
+    chunk: ReadableBuffer
+    if isinstance(reader, asyncio.StreamReader):
+        while True:
+            chunk = await reader.read(chunk_size)
+            if not chunk:
+                break
+
+            await hasher.update(chunk)
+    else:
+        async for chunk in reader:
+            await hasher.update(chunk)
+
+    return await hasher.result()
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from purehash._common import Hash
-from purehash._util import left_rotate, pack, padding, unpack
+from typing import Any, Callable, Iterable
+
+from purehash._codegen import compile_function, mask, rotate_left
+from purehash._common import Hash, hash_many
+from purehash._util import ReadableBuffer, get_struct
 
 SHIFTS: tuple[int, ...] = (
     7,
@@ -137,91 +140,102 @@ SINES: tuple[int, ...] = (
 )
 
 
+def _generate_compress() -> Callable[..., tuple[int, ...]]:
+    m: str = mask(32)
+    lines: list[str] = [
+        "def compress(state, block):",
+        "    a, b, c, d = state",
+        "    " + ", ".join(f"m{i}" for i in range(16)) + " = unpack(block)",
+    ]
+
+    # Rather than shuffling a, b, c and d each round, rotate the names instead.
+    names: tuple[str, ...] = ("a", "b", "c", "d")
+
+    i: int
+    f: str
+    g: int
+    for i in range(64):
+        a, b, c, d = names
+
+        if i < 16:
+            f = f"({d} ^ ({b} & ({c} ^ {d})))"
+            g = i
+        elif i < 32:
+            f = f"({c} ^ ({d} & ({b} ^ {c})))"
+            g = (5 * i + 1) % 16
+        elif i < 48:
+            f = f"({b} ^ {c} ^ {d})"
+            g = (3 * i + 5) % 16
+        else:
+            f = f"({c} ^ ({b} | ({d} ^ {m})))"
+            g = (7 * i) % 16
+
+        lines += [
+            f"    t = ({a} + {f} + {SINES[i]:#010x} + m{g}) & {m}",
+            f"    {a} = ({b} + {rotate_left('t', SHIFTS[i], 32)}) & {m}",
+        ]
+
+        names = (d, a, b, c)
+
+    lines.append(
+        "    return ("
+        + ", ".join(f"(state[{i}] + {name}) & {m}" for i, name in enumerate(names))
+        + ")"
+    )
+
+    return compile_function(
+        "compress", lines, {"unpack": get_struct(4, True, 16).unpack}
+    )
+
+
+def _compress_lanes(state: list[Any], block: Any) -> list[Any]:
+    # Operates on NumPy uint32 arrays holding one message per lane.
+    m: list[Any] = [block[:, i] for i in range(16)]
+
+    a: Any
+    b: Any
+    c: Any
+    d: Any
+    a, b, c, d = state
+
+    i: int
+    f: Any
+    g: int
+    for i in range(64):
+        if i < 16:
+            f = d ^ (b & (c ^ d))
+            g = i
+        elif i < 32:
+            f = c ^ (d & (b ^ c))
+            g = (5 * i + 1) % 16
+        elif i < 48:
+            f = b ^ c ^ d
+            g = (3 * i + 5) % 16
+        else:
+            f = c ^ (b | ~d)
+            g = (7 * i) % 16
+
+        f = f + a + SINES[i] + m[g]
+        a = d
+        d = c
+        c = b
+        b = b + ((f << SHIFTS[i]) | (f >> (32 - SHIFTS[i])))
+
+    return [state[0] + a, state[1] + b, state[2] + c, state[3] + d]
+
+
 class MD5(Hash):
-    _a: int
-    _b: int
-    _c: int
-    _d: int
-
-    def __init__(self, message: bytes = b"") -> None:
-        self._a = 0x67452301
-        self._b = 0xEFCDAB89
-        self._c = 0x98BADCFE
-        self._d = 0x10325476
-
-        super().__init__(message=message)
-
-    def _process_block(self, block: bytes) -> None:
-        m: tuple[int, ...] = unpack(4, True, block)
-
-        a: int = self._a
-        b: int = self._b
-        c: int = self._c
-        d: int = self._d
-
-        i: int
-        f: int
-        g: int
-        for i in range(64):
-            if i < 16:
-                f = (b & c) | ((~b) & d)
-                g = i
-            elif i < 32:
-                f = (d & b) | ((~d) & c)
-                g = (5 * i + 1) % 16
-            elif i < 48:
-                f = b ^ c ^ d
-                g = (3 * i + 5) % 16
-            else:
-                f = c ^ (b | (~d))
-                g = (7 * i) % 16
-
-            f = (f + a + SINES[i] + m[g]) % (2**32)
-            a = d
-            d = c
-            c = b
-            b = b + left_rotate(f, SHIFTS[i], 32)
-
-        self._a = (self._a + a) % (2**32)
-        self._b = (self._b + b) % (2**32)
-        self._c = (self._c + c) % (2**32)
-        self._d = (self._d + d) % (2**32)
-
-    def update(self, message: bytes) -> None:
-        self._buffer += message
-
-        for _ in range(len(self._buffer) // 64):
-            self._process_block(self._buffer[:64])
-
-            self._blocks_processed += 1
-            self._buffer = self._buffer[64:]
-
-    def digest(self) -> bytes:
-        # Save state.
-        a: int = self._a
-        b: int = self._b
-        c: int = self._c
-        d: int = self._d
-
-        buffer_length: int = len(self._buffer)
-        self._buffer += padding(
-            (self._blocks_processed * 64) + buffer_length, 64, 8, True
-        )
-
-        self._process_block(self._buffer[:64])
-
-        if len(self._buffer) == 128:
-            self._process_block(self._buffer[64:])
-
-        result: bytes = pack(4, True, self._a, self._b, self._c, self._d)
-
-        # Restore state.
-        self._a = a
-        self._b = b
-        self._c = c
-        self._d = d
-
-        # Restore buffer.
-        self._buffer = self._buffer[:buffer_length]
-
-        return result
+    __slots__ = ()
+
+    name = "md5"
+    _block_size = 64
+    _word_size = 4
+    _digest_size = 16
+    _little_endian = True
+    _initial_state = (0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476)
+    _compress = staticmethod(_generate_compress())
+    _compress_lanes = staticmethod(_compress_lanes)
+
+
+def md5_many(messages: Iterable[ReadableBuffer]) -> list[bytes]:
+    return hash_many(MD5, messages)
@@ -1,104 +1,120 @@
 from __future__ import annotations
-
-from purehash._common import Hash
-from purehash._util import left_rotate, pack, padding, unpack
+from typing import Any, Callable, Iterable
+
+from purehash._codegen import compile_function, mask, rotate_left
+from purehash._common import Hash, hash_many
+from purehash._util import ReadableBuffer, get_struct
+
+
+def _generate_compress() -> Callable[..., tuple[int, ...]]:
+    m: str = mask(32)
+    lines: list[str] = [
+        "def compress(state, block):",
+        "    a, b, c, d, e = state",
+        "    " + ", ".join(f"w{i}" for i in range(16)) + " = unpack(block)",
+    ]
+
+    i: int
+    for i in range(16, 80):
+        lines += [
+            f"    t = w{i - 3} ^ w{i - 8} ^ w{i - 14} ^ w{i - 16}",
+            f"    w{i} = {rotate_left('t', 1, 32)} & {m}",
+        ]
+
+    # Rather than shuffling a to e each round, rotate the names instead.
+    names: tuple[str, ...] = ("a", "b", "c", "d", "e")
+
+    f: str
+    k: int
+    for i in range(80):
+        a, b, c, d, e = names
+
+        if i < 20:
+            f = f"({d} ^ ({b} & ({c} ^ {d})))"
+            k = 0x5A827999
+        elif i < 40:
+            f = f"({b} ^ {c} ^ {d})"
+            k = 0x6ED9EBA1
+        elif i < 60:
+            f = f"(({b} & {c}) | ({d} & ({b} | {c})))"
+            k = 0x8F1BBCDC
+        else:
+            f = f"({b} ^ {c} ^ {d})"
+            k = 0xCA62C1D6
+
+        lines += [
+            f"    {e} = ({rotate_left(a, 5, 32)} + {f} + {e} + {k:#010x} + w{i}) & {m}",
+            f"    {b} = {rotate_left(b, 30, 32)} & {m}",
+        ]
+
+        names = (e, a, b, c, d)
+
+    lines.append(
+        "    return ("
+        + ", ".join(f"(state[{i}] + {name}) & {m}" for i, name in enumerate(names))
+        + ")"
+    )
+
+    return compile_function(
+        "compress", lines, {"unpack": get_struct(4, False, 16).unpack}
+    )
+
+
+def _compress_lanes(state: list[Any], block: Any) -> list[Any]:
+    # Operates on NumPy uint32 arrays holding one message per lane.
+    w: list[Any] = [block[:, i] for i in range(16)]
+
+    i: int
+    t: Any
+    for i in range(16, 80):
+        t = w[i - 3] ^ w[i - 8] ^ w[i - 14] ^ w[i - 16]
+        w.append((t << 1) | (t >> 31))
+
+    a: Any
+    b: Any
+    c: Any
+    d: Any
+    e: Any
+    a, b, c, d, e = state
+
+    f: Any
+    k: int
+    for i in range(80):
+        if i < 20:
+            f = d ^ (b & (c ^ d))
+            k = 0x5A827999
+        elif i < 40:
+            f = b ^ c ^ d
+            k = 0x6ED9EBA1
+        elif i < 60:
+            f = (b & c) | (d & (b | c))
+            k = 0x8F1BBCDC
+        else:
+            f = b ^ c ^ d
+            k = 0xCA62C1D6
+
+        t = ((a << 5) | (a >> 27)) + f + e + k + w[i]
+        e = d
+        d = c
+        c = (b << 30) | (b >> 2)
+        b = a
+        a = t
+
+    return [state[0] + a, state[1] + b, state[2] + c, state[3] + d, state[4] + e]
 
 
 class SHA1(Hash):
-    _a: int
-    _b: int
-    _c: int
-    _d: int
-    _e: int
-
-    def __init__(self, message: bytes = b""):
-        self._a = 0x67452301
-        self._b = 0xEFCDAB89
-        self._c = 0x98BADCFE
-        self._d = 0x10325476
-        self._e = 0xC3D2E1F0
-
-        super().__init__(message=message)
-
-    def _process_block(self, block: bytes) -> None:
-        w: list[int] = list(unpack(4, False, block))
-
-        for i in range(16, 80):
-            w.append(left_rotate(w[i - 3] ^ w[i - 8] ^ w[i - 14] ^ w[i - 16], 1, 32))
-
-        a: int = self._a
-        b: int = self._b
-        c: int = self._c
-        d: int = self._d
-        e: int = self._e
-
-        f: int
-        k: int
-        temp: int
-        for i in range(80):
-            if i < 20:
-                f = (b & c) | ((~b) & d)
-                k = 0x5A827999
-            elif i < 40:
-                f = b ^ c ^ d
-                k = 0x6ED9EBA1
-            elif i < 60:
-                f = (b & c) | (b & d) | (c & d)
-                k = 0x8F1BBCDC
-            else:
-                f = b ^ c ^ d
-                k = 0xCA62C1D6
-
-            temp = (left_rotate(a, 5, 32) + f + e + k + w[i]) % (2**32)
-            e = d
-            d = c
-            c = left_rotate(b, 30, 32)
-            b = a
-            a = temp
-
-        self._a = (self._a + a) % (2**32)
-        self._b = (self._b + b) % (2**32)
-        self._c = (self._c + c) % (2**32)
-        self._d = (self._d + d) % (2**32)
-        self._e = (self._e + e) % (2**32)
-
-    def update(self, message: bytes) -> None:
-        self._buffer += message
-
-        for _ in range(len(self._buffer) // 64):
-            self._process_block(self._buffer[:64])
-
-            self._blocks_processed += 1
-            self._buffer = self._buffer[64:]
-
-    def digest(self) -> bytes:
-        # Save state.
-        a: int = self._a
-        b: int = self._b
-        c: int = self._c
-        d: int = self._d
-        e: int = self._e
-
-        buffer_length: int = len(self._buffer)
-        self._buffer += padding(
-            (self._blocks_processed * 64) + buffer_length, 64, 8, False
-        )
-
-        self._process_block(self._buffer[:64])
-
-        if len(self._buffer) == 128:
-            self._process_block(self._buffer[64:])
-
-        result: bytes = pack(4, False, self._a, self._b, self._c, self._d, self._e)
-
-        # Restore state.
-        self._a = a
-        self._b = b
-        self._c = c
-        self._d = d
-        self._e = e
-
-        # Restore buffer.
-        self._buffer = self._buffer[:buffer_length]
-
-        return result
+    __slots__ = ()
+
+    name = "sha1"
+    _block_size = 64
+    _word_size = 4
+    _digest_size = 20
+    _little_endian = False
+    _initial_state = (0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476, 0xC3D2E1F0)
+    _compress = staticmethod(_generate_compress())
+    _compress_lanes = staticmethod(_compress_lanes)
+
+
+def sha1_many(messages: Iterable[ReadableBuffer]) -> list[bytes]:
+    return hash_many(SHA1, messages)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from purehash._common import Hash
-from purehash._util import pack, padding, right_rotate, unpack
+from typing import Any, Callable, Iterable
+
+from purehash._codegen import compile_function, mask, rotate_right
+from purehash._common import Hash, hash_many
+from purehash._util import ReadableBuffer, get_struct
 
 SHA256_CONSTANTS: tuple[int, ...] = (
     0x428A2F98,
@@ -71,153 +74,6 @@ SHA256_CONSTANTS: tuple[int, ...] = (
 )
 
 
-class SHA256(Hash):
-    _a: int
-    _b: int
-    _c: int
-    _d: int
-    _e: int
-    _f: int
-    _g: int
-    _h: int
-
-    def __init__(self, message: bytes = b"") -> None:
-        self._a = 0x6A09E667
-        self._b = 0xBB67AE85
-        self._c = 0x3C6EF372
-        self._d = 0xA54FF53A
-        self._e = 0x510E527F
-        self._f = 0x9B05688C
-        self._g = 0x1F83D9AB
-        self._h = 0x5BE0CD19
-
-        super().__init__(message=message)
-
-    def _process_block(self, block: bytes) -> None:
-        w: list[int] = list(unpack(4, False, block))
-
-        i: int
-        s0: int
-        s1: int
-        for i in range(16, 64):
-            s0 = (
-                right_rotate(w[i - 15], 7, 32)
-                ^ right_rotate(w[i - 15], 18, 32)
-                ^ (w[i - 15] >> 3)
-            )
-            s1 = (
-                right_rotate(w[i - 2], 17, 32)
-                ^ right_rotate(w[i - 2], 19, 32)
-                ^ (w[i - 2] >> 10)
-            )
-            w.append((w[i - 16] + s0 + w[i - 7] + s1) % (2**32))
-
-        a: int = self._a
-        b: int = self._b
-        c: int = self._c
-        d: int = self._d
-        e: int = self._e
-        f: int = self._f
-        g: int = self._g
-        h: int = self._h
-
-        ch: int
-        temp0: int
-        maj: int
-        temp1: int
-        for i in range(64):
-            s1 = (
-                right_rotate(e, 6, 32)
-                ^ right_rotate(e, 11, 32)
-                ^ right_rotate(e, 25, 32)
-            )
-            ch = (e & f) ^ ((~e) & g)
-            temp0 = (h + s1 + ch + SHA256_CONSTANTS[i] + w[i]) % (2**32)
-            s0 = (
-                right_rotate(a, 2, 32)
-                ^ right_rotate(a, 13, 32)
-                ^ right_rotate(a, 22, 32)
-            )
-            maj = (a & b) ^ (a & c) ^ (b & c)
-            temp1 = (s0 + maj) % (2**32)
-
-            h = g
-            g = f
-            f = e
-            e = (d + temp0) % (2**32)
-            d = c
-            c = b
-            b = a
-            a = (temp0 + temp1) % (2**32)
-
-        self._a = (self._a + a) % (2**32)
-        self._b = (self._b + b) % (2**32)
-        self._c = (self._c + c) % (2**32)
-        self._d = (self._d + d) % (2**32)
-        self._e = (self._e + e) % (2**32)
-        self._f = (self._f + f) % (2**32)
-        self._g = (self._g + g) % (2**32)
-        self._h = (self._h + h) % (2**32)
-
-    def update(self, message: bytes) -> None:
-        self._buffer += message
-
-        for _ in range(len(self._buffer) // 64):
-            self._process_block(self._buffer[:64])
-
-            self._blocks_processed += 1
-            self._buffer = self._buffer[64:]
-
-    def digest(self) -> bytes:
-        # Save state.
-        a: int = self._a
-        b: int = self._b
-        c: int = self._c
-        d: int = self._d
-        e: int = self._e
-        f: int = self._f
-        g: int = self._g
-        h: int = self._h
-
-        buffer_length: int = len(self._buffer)
-        self._buffer += padding(
-            (self._blocks_processed * 64) + buffer_length, 64, 8, False
-        )
-
-        self._process_block(self._buffer[:64])
-
-        if len(self._buffer) == 128:
-            self._process_block(self._buffer[64:])
-
-        result: bytes = pack(
-            4,
-            False,
-            self._a,
-            self._b,
-            self._c,
-            self._d,
-            self._e,
-            self._f,
-            self._g,
-            self._h,
-        )
-
-        # Restore state.
-        self._a = a
-        self._b = b
-        self._c = c
-        self._d = d
-        self._e = e
-        self._f = f
-        self._g = g
-        self._h = h
-
-        # Restore buffer.
-        self._buffer = self._buffer[:buffer_length]
-
-        return result
-
-
 SHA512_CONSTANTS: tuple[int, ...] = (
     0x428A2F98D728AE22,
     0x7137449123EF65CD,
@@ -302,148 +158,293 @@ SHA512_CONSTANTS: tuple[int, ...] = (
 )
 
 
-class SHA512(Hash):
-    _a: int
-    _b: int
-    _c: int
-    _d: int
-    _e: int
-    _f: int
-    _g: int
-    _h: int
-
-    def __init__(self, message: bytes = b"") -> None:
-        self._a = 0x6A09E667F3BCC908
-        self._b = 0xBB67AE8584CAA73B
-        self._c = 0x3C6EF372FE94F82B
-        self._d = 0xA54FF53A5F1D36F1
-        self._e = 0x510E527FADE682D1
-        self._f = 0x9B05688C2B3E6C1F
-        self._g = 0x1F83D9ABFB41BD6B
-        self._h = 0x5BE0CD19137E2179
-
-        super().__init__(message=message)
-
-    def _process_block(self, block: bytes) -> None:
-        w: list[int] = list(unpack(8, False, block))
+def _generate_compress(
+    constants: tuple[int, ...],
+    bits: int,
+    sigma: tuple[tuple[int, int, int], tuple[int, int, int]],
+    big_sigma: tuple[tuple[int, int, int], tuple[int, int, int]],
+) -> Callable[..., tuple[int, ...]]:
+    m: str = mask(bits)
+    lines: list[str] = [
+        "def compress(state, block):",
+        "    a, b, c, d, e, f, g, h = state",
+        "    " + ", ".join(f"w{i}" for i in range(16)) + " = unpack(block)",
+    ]
+
+    def sigma_(expression: str, rotations: tuple[int, int, int]) -> str:
+        return (
+            f"({rotate_right(expression, rotations[0], bits)}"
+            f" ^ {rotate_right(expression, rotations[1], bits)}"
+            f" ^ {expression} >> {rotations[2]})"
+        )
+
+    def big_sigma_(expression: str, rotations: tuple[int, int, int]) -> str:
+        return " ^ ".join(
+            rotate_right(expression, rotation, bits) for rotation in rotations
+        )
+
+    i: int
+    for i in range(16, len(constants)):
+        lines.append(
+            f"    w{i} = (w{i - 16} + {sigma_(f'w{i - 15}', sigma[0])} + w{i - 7}"
+            f" + {sigma_(f'w{i - 2}', sigma[1])}) & {m}"
+        )
+
+    # Rather than shuffling a to h each round, rotate the names instead.
+    names: tuple[str, ...] = ("a", "b", "c", "d", "e", "f", "g", "h")
+
+    for i in range(len(constants)):
+        a, b, c, d, e, f, g, h = names
+
+        lines += [
+            f"    t = {h} + ({big_sigma_(e, big_sigma[1])})"
+            f" + ({g} ^ ({e} & ({f} ^ {g}))) + {constants[i]:#x} + w{i}",
+            f"    {d} = ({d} + t) & {m}",
+            f"    {h} = (t + ({big_sigma_(a, big_sigma[0])})"
+            f" + (({a} & {b}) | ({c} & ({a} | {b})))) & {m}",
+        ]
+
+        names = (h, a, b, c, d, e, f, g)
+
+    lines.append(
+        "    return ("
+        + ", ".join(f"(state[{i}] + {name}) & {m}" for i, name in enumerate(names))
+        + ")"
+    )
+
+    return compile_function(
+        "compress", lines, {"unpack": get_struct(bits // 8, False, 16).unpack}
+    )
+
+
+def _generate_compress_lanes(
+    constants: tuple[int, ...],
+    bits: int,
+    sigma: tuple[tuple[int, int, int], tuple[int, int, int]],
+    big_sigma: tuple[tuple[int, int, int], tuple[int, int, int]],
+) -> Callable[[list[Any], Any], list[Any]]:
+    # Operates on NumPy uint32 or uint64 arrays holding one message per lane.
+    def rotate(x: Any, rotation: int) -> Any:
+        return (x >> rotation) | (x << (bits - rotation))
+
+    def sigma_(x: Any, rotations: tuple[int, int, int]) -> Any:
+        return rotate(x, rotations[0]) ^ rotate(x, rotations[1]) ^ (x >> rotations[2])
+
+    def big_sigma_(x: Any, rotations: tuple[int, int, int]) -> Any:
+        return (
+            rotate(x, rotations[0]) ^ rotate(x, rotations[1]) ^ rotate(x, rotations[2])
+        )
+
+    def compress_lanes(state: list[Any], block: Any) -> list[Any]:
+        w: list[Any] = [block[:, i] for i in range(16)]
 
         i: int
-        s0: int
-        s1: int
-        for i in range(16, 80):
-            s0 = (
-                right_rotate(w[i - 15], 1, 64)
-                ^ right_rotate(w[i - 15], 8, 64)
-                ^ (w[i - 15] >> 7)
+        for i in range(16, len(constants)):
+            w.append(
+                w[i - 16]
+                + sigma_(w[i - 15], sigma[0])
+                + w[i - 7]
+                + sigma_(w[i - 2], sigma[1])
             )
-            s1 = (
-                right_rotate(w[i - 2], 19, 64)
-                ^ right_rotate(w[i - 2], 61, 64)
-                ^ (w[i - 2] >> 6)
-            )
-            w.append((w[i - 16] + s0 + w[i - 7] + s1) % (2**64))
-
-        a: int = self._a
-        b: int = self._b
-        c: int = self._c
-        d: int = self._d
-        e: int = self._e
-        f: int = self._f
-        g: int = self._g
-        h: int = self._h
-
-        ch: int
-        temp0: int
-        maj: int
-        temp1: int
-        for i in range(80):
-            s1 = (
-                right_rotate(e, 14, 64)
-                ^ right_rotate(e, 18, 64)
-                ^ right_rotate(e, 41, 64)
-            )
-            ch = (e & f) ^ ((~e) & g)
-            temp0 = (h + s1 + ch + SHA512_CONSTANTS[i] + w[i]) % (2**64)
-            s0 = (
-                right_rotate(a, 28, 64)
-                ^ right_rotate(a, 34, 64)
-                ^ right_rotate(a, 39, 64)
-            )
-            maj = (a & b) ^ (a & c) ^ (b & c)
-            temp1 = (s0 + maj) % (2**64)
 
+        a: Any
+        b: Any
+        c: Any
+        d: Any
+        e: Any
+        f: Any
+        g: Any
+        h: Any
+        a, b, c, d, e, f, g, h = state
+
+        t: Any
+        for i in range(len(constants)):
+            t = (
+                h
+                + big_sigma_(e, big_sigma[1])
+                + (g ^ (e & (f ^ g)))
+                + constants[i]
+                + w[i]
+            )
             h = g
             g = f
             f = e
-            e = (d + temp0) % (2**64)
+            e = d + t
             d = c
             c = b
             b = a
-            a = (temp0 + temp1) % (2**64)
-
-        self._a = (self._a + a) % (2**64)
-        self._b = (self._b + b) % (2**64)
-        self._c = (self._c + c) % (2**64)
-        self._d = (self._d + d) % (2**64)
-        self._e = (self._e + e) % (2**64)
-        self._f = (self._f + f) % (2**64)
-        self._g = (self._g + g) % (2**64)
-        self._h = (self._h + h) % (2**64)
-
-    def update(self, message: bytes) -> None:
-        self._buffer += message
-
-        for _ in range(len(self._buffer) // 128):
-            self._process_block(self._buffer[:128])
-
-            self._blocks_processed += 1
-            self._buffer = self._buffer[128:]
-
-    def digest(self) -> bytes:
-        # Save state.
-        a: int = self._a
-        b: int = self._b
-        c: int = self._c
-        d: int = self._d
-        e: int = self._e
-        f: int = self._f
-        g: int = self._g
-        h: int = self._h
-
-        buffer_length: int = len(self._buffer)
-        self._buffer += padding(
-            (self._blocks_processed * 128) + buffer_length, 128, 16, False
-        )
+            a = t + big_sigma_(b, big_sigma[0]) + ((b & c) | (d & (b | c)))
 
-        self._process_block(self._buffer[:128])
-
-        if len(self._buffer) == 256:
-            self._process_block(self._buffer[128:])
-
-        result: bytes = pack(
-            8,
-            False,
-            self._a,
-            self._b,
-            self._c,
-            self._d,
-            self._e,
-            self._f,
-            self._g,
-            self._h,
-        )
+        return [x + y for x, y in zip(state, (a, b, c, d, e, f, g, h))]
 
-        # Restore state.
-        self._a = a
-        self._b = b
-        self._c = c
-        self._d = d
-        self._e = e
-        self._f = f
-        self._g = g
-        self._h = h
+    return compress_lanes
 
-        # Restore buffer.
-        self._buffer = self._buffer[:buffer_length]
 
-        return result
+_compress_32: Callable[..., tuple[int, ...]] = _generate_compress(
+    SHA256_CONSTANTS, 32, ((7, 18, 3), (17, 19, 10)), ((2, 13, 22), (6, 11, 25))
+)
+_compress_lanes_32: Callable[[list[Any], Any], list[Any]] = _generate_compress_lanes(
+    SHA256_CONSTANTS, 32, ((7, 18, 3), (17, 19, 10)), ((2, 13, 22), (6, 11, 25))
+)
+_compress_64: Callable[..., tuple[int, ...]] = _generate_compress(
+    SHA512_CONSTANTS, 64, ((1, 8, 7), (19, 61, 6)), ((28, 34, 39), (14, 18, 41))
+)
+_compress_lanes_64: Callable[[list[Any], Any], list[Any]] = _generate_compress_lanes(
+    SHA512_CONSTANTS, 64, ((1, 8, 7), (19, 61, 6)), ((28, 34, 39), (14, 18, 41))
+)
+
+
+class SHA224(Hash):
+    __slots__ = ()
+
+    name = "sha224"
+    _block_size = 64
+    _word_size = 4
+    _digest_size = 28
+    _little_endian = False
+    _initial_state = (
+        0xC1059ED8,
+        0x367CD507,
+        0x3070DD17,
+        0xF70E5939,
+        0xFFC00B31,
+        0x68581511,
+        0x64F98FA7,
+        0xBEFA4FA4,
+    )
+    _compress = staticmethod(_compress_32)
+    _compress_lanes = staticmethod(_compress_lanes_32)
+
+
+class SHA256(Hash):
+    __slots__ = ()
+
+    name = "sha256"
+    _block_size = 64
+    _word_size = 4
+    _digest_size = 32
+    _little_endian = False
+    _initial_state = (
+        0x6A09E667,
+        0xBB67AE85,
+        0x3C6EF372,
+        0xA54FF53A,
+        0x510E527F,
+        0x9B05688C,
+        0x1F83D9AB,
+        0x5BE0CD19,
+    )
+    _compress = staticmethod(_compress_32)
+    _compress_lanes = staticmethod(_compress_lanes_32)
+
+
+class SHA384(Hash):
+    __slots__ = ()
+
+    name = "sha384"
+    _block_size = 128
+    _word_size = 8
+    _digest_size = 48
+    _little_endian = False
+    _initial_state = (
+        0xCBBB9D5DC1059ED8,
+        0x629A292A367CD507,
+        0x9159015A3070DD17,
+        0x152FECD8F70E5939,
+        0x67332667FFC00B31,
+        0x8EB44A8768581511,
+        0xDB0C2E0D64F98FA7,
+        0x47B5481DBEFA4FA4,
+    )
+    _compress = staticmethod(_compress_64)
+    _compress_lanes = staticmethod(_compress_lanes_64)
+
+
+class SHA512(Hash):
+    __slots__ = ()
+
+    name = "sha512"
+    _block_size = 128
+    _word_size = 8
+    _digest_size = 64
+    _little_endian = False
+    _initial_state = (
+        0x6A09E667F3BCC908,
+        0xBB67AE8584CAA73B,
+        0x3C6EF372FE94F82B,
+        0xA54FF53A5F1D36F1,
+        0x510E527FADE682D1,
+        0x9B05688C2B3E6C1F,
+        0x1F83D9ABFB41BD6B,
+        0x5BE0CD19137E2179,
+    )
+    _compress = staticmethod(_compress_64)
+    _compress_lanes = staticmethod(_compress_lanes_64)
+
+
+class SHA512_224(Hash):
+    __slots__ = ()
+
+    name = "sha512_224"
+    _block_size = 128
+    _word_size = 8
+    _digest_size = 28
+    _little_endian = False
+    _initial_state = (
+        0x8C3D37C819544DA2,
+        0x73E1996689DCD4D6,
+        0x1DFAB7AE32FF9C82,
+        0x679DD514582F9FCF,
+        0x0F6D2B697BD44DA8,
+        0x77E36F7304C48942,
+        0x3F9D85A86A1D36C8,
+        0x1112E6AD91D692A1,
+    )
+    _compress = staticmethod(_compress_64)
+    _compress_lanes = staticmethod(_compress_lanes_64)
+
+
+class SHA512_256(Hash):
+    __slots__ = ()
+
+    name = "sha512_256"
+    _block_size = 128
+    _word_size = 8
+    _digest_size = 32
+    _little_endian = False
+    _initial_state = (
+        0x22312194FC2BF72C,
+        0x9F555FA3C84C64C2,
+        0x2393B86B6F53B151,
+        0x963877195940EABD,
+        0x96283EE2A88EFFE3,
+        0xBE5E1E2553863992,
+        0x2B0199FC2C85B8AA,
+        0x0EB72DDC81C52CA2,
+    )
+    _compress = staticmethod(_compress_64)
+    _compress_lanes = staticmethod(_compress_lanes_64)
+
+
+def sha224_many(messages: Iterable[ReadableBuffer]) -> list[bytes]:
+    return hash_many(SHA224, messages)
+
+
+def sha256_many(messages: Iterable[ReadableBuffer]) -> list[bytes]:
+    return hash_many(SHA256, messages)
+
+
+def sha384_many(messages: Iterable[ReadableBuffer]) -> list[bytes]:
+    return hash_many(SHA384, messages)
+
+
+def sha512_many(messages: Iterable[ReadableBuffer]) -> list[bytes]:
+    return hash_many(SHA512, messages)
+
+
+def sha512_224_many(messages: Iterable[ReadableBuffer]) -> list[bytes]:
+    return hash_many(SHA512_224, messages)
+
+
+def sha512_256_many(messages: Iterable[ReadableBuffer]) -> list[bytes]:
+    return hash_many(SHA512_256, messages)
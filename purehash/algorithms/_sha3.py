@@ -0,0 +1,317 @@
+from __future__ import annotations
+from functools import lru_cache
+from typing import Any, Callable, Iterable, TypeVar
+
+from purehash._codegen import compile_function, mask, rotate_left
+from purehash._common import Hash, hash_many
+from purehash._util import ReadableBuffer, get_struct, pack
+
+SHAKEType = TypeVar("SHAKEType", bound="_SHAKE")
+
+ROUND_CONSTANTS: tuple[int, ...] = (
+    0x0000000000000001,
+    0x0000000000008082,
+    0x800000000000808A,
+    0x8000000080008000,
+    0x000000000000808B,
+    0x0000000080000001,
+    0x8000000080008081,
+    0x8000000000008009,
+    0x000000000000008A,
+    0x0000000000000088,
+    0x0000000080008009,
+    0x000000008000000A,
+    0x000000008000808B,
+    0x800000000000008B,
+    0x8000000000008089,
+    0x8000000000008003,
+    0x8000000000008002,
+    0x8000000000000080,
+    0x000000000000800A,
+    0x800000008000000A,
+    0x8000000080008081,
+    0x8000000000008080,
+    0x0000000080000001,
+    0x8000000080008008,
+)
+
+# Rotation for the lane at x + 5 * y, applied during rho.
+ROTATIONS: tuple[int, ...] = (
+    0,
+    1,
+    62,
+    28,
+    27,
+    36,
+    44,
+    6,
+    55,
+    20,
+    3,
+    10,
+    43,
+    25,
+    39,
+    41,
+    45,
+    15,
+    21,
+    8,
+    18,
+    2,
+    61,
+    56,
+    14,
+)
+
+
+def _pi(i: int) -> int:
+    # Where pi moves the lane at i = x + 5 * y: to (y, 2x + 3y).
+    x: int = i % 5
+    y: int = i // 5
+
+    return y + 5 * ((2 * x + 3 * y) % 5)
+
+
+def _chi(i: int) -> tuple[int, int]:
+    # The two lanes to the right of i, within its row.
+    return i - i % 5 + (i + 1) % 5, i - i % 5 + (i + 2) % 5
+
+
+@lru_cache(maxsize=None)
+def _generate_compress(rate: int) -> Callable[..., tuple[int, ...]]:
+    # Absorbs one block of rate bytes into the state, then applies Keccak-f[1600].
+    # Each round is unrolled, with the 24 rounds looping over the round constants.
+    m: str = mask(64)
+    words: int = rate // 8
+    lines: list[str] = [
+        "def compress(state, block):",
+        "    " + ", ".join(f"a{i}" for i in range(25)) + " = state",
+        "    " + ", ".join(f"w{i}" for i in range(words)) + " = unpack(block)",
+    ]
+
+    i: int
+    for i in range(words):
+        lines.append(f"    a{i} ^= w{i}")
+
+    lines.append("    for rc in ROUND_CONSTANTS:")
+
+    # Theta.
+    x: int
+    for x in range(5):
+        lines.append(f"        c{x} = " + " ^ ".join(f"a{x + 5 * y}" for y in range(5)))
+
+    for x in range(5):
+        lines.append(
+            f"        d{x} = c{(x - 1) % 5}"
+            f" ^ ({rotate_left(f'c{(x + 1) % 5}', 1, 64)} & {m})"
+        )
+
+    # Rho and pi, from a into b.
+    for i in range(25):
+        lane: str = f"(a{i} ^ d{i % 5})"
+        lines.append(
+            f"        b{_pi(i)} = ({rotate_left(lane, ROTATIONS[i], 64)} & {m})"
+            if ROTATIONS[i]
+            else f"        b{_pi(i)} = {lane}"
+        )
+
+    # Chi and iota, from b back into a. Masking ~b is unnecessary, as the other
+    # operand of & is never negative.
+    for i in range(25):
+        right: int
+        far_right: int
+        right, far_right = _chi(i)
+        lines.append(
+            f"        a{i} = b{i} ^ (~b{right} & b{far_right})"
+            + (" ^ rc" if not i else "")
+        )
+
+    lines.append("    return (" + ", ".join(f"a{i}" for i in range(25)) + ")")
+
+    return compile_function(
+        "compress",
+        lines,
+        {
+            "unpack": get_struct(8, True, words).unpack,
+            "ROUND_CONSTANTS": ROUND_CONSTANTS,
+        },
+    )
+
+
+def _compress_lanes(state: list[Any], block: Any) -> list[Any]:
+    # Operates on NumPy uint64 arrays holding one message per lane.
+    a: list[Any] = [
+        lane ^ block[:, i] if i < block.shape[1] else lane
+        for i, lane in enumerate(state)
+    ]
+
+    rc: int
+    for rc in ROUND_CONSTANTS:
+        c: list[Any] = [
+            a[x] ^ a[x + 5] ^ a[x + 10] ^ a[x + 15] ^ a[x + 20] for x in range(5)
+        ]
+        d: list[Any] = [
+            c[(x - 1) % 5] ^ ((c[(x + 1) % 5] << 1) | (c[(x + 1) % 5] >> 63))
+            for x in range(5)
+        ]
+
+        b: list[Any] = [None] * 25
+
+        i: int
+        for i in range(25):
+            lane: Any = a[i] ^ d[i % 5]
+            rotation: int = ROTATIONS[i]
+            b[_pi(i)] = (
+                (lane << rotation) | (lane >> (64 - rotation)) if rotation else lane
+            )
+
+        a = [b[i] ^ (~b[_chi(i)[0]] & b[_chi(i)[1]]) for i in range(25)]
+        a[0] = a[0] ^ rc
+
+    return a
+
+
+@lru_cache(maxsize=None)
+def _padding_fills(rate: int, domain: int) -> tuple[bytes, ...]:
+    # pad10*1 after the domain separation bits, for every possible final block
+    # length. When only one byte is left, the domain and final bits share it.
+    fills: list[bytes] = []
+
+    i: int
+    for i in range(rate):
+        fill: bytearray = bytearray(rate - i)
+        fill[0] ^= domain
+        fill[-1] ^= 0x80
+        fills.append(bytes(fill))
+
+    return tuple(fills)
+
+
+class _Keccak(Hash):
+    __slots__ = ()
+
+    # The block size is the sponge rate. The remaining 200 - rate bytes of the
+    # state are the capacity, which input never touches directly.
+    _word_size = 8
+    _little_endian = True
+    _initial_state = (0,) * 25
+    _compress_lanes = staticmethod(_compress_lanes)
+    _domain: int
+
+    @classmethod
+    def _padding(cls, length: int) -> bytes:
+        return _padding_fills(cls._block_size, cls._domain)[length % cls._block_size]
+
+
+class _SHAKE(_Keccak):
+    # Output squeezed so far is kept in _digest, alongside the state it was
+    # squeezed from, so that longer digests only permute for the new blocks.
+    __slots__ = ("_squeeze_state",)
+
+    _squeeze_state: tuple[int, ...]
+
+    _extendable_output = True
+
+    def digest(self, length: int) -> bytes:  # type: ignore[override]
+        if length < 0:
+            raise ValueError("length must not be negative.")
+
+        rate: int = self._block_size
+
+        if self._digest is None:
+            tail: bytearray = self._buffer + self._padding(len(self._buffer))
+            self._squeeze_state = self._compress(self._state, tail)
+            self._digest = pack(8, True, *self._squeeze_state)[:rate]
+
+        while len(self._digest) < length:
+            self._squeeze_state = self._compress(self._squeeze_state, bytes(rate))
+            self._digest += pack(8, True, *self._squeeze_state)[:rate]
+
+        return self._digest[:length]
+
+    def hexdigest(self, length: int) -> str:  # type: ignore[override]
+        return self.digest(length).hex()
+
+    def copy(self: SHAKEType) -> SHAKEType:
+        copy_: SHAKEType = super().copy()
+        if self._digest is not None:
+            copy_._squeeze_state = self._squeeze_state
+
+        return copy_
+
+
+class SHA3_224(_Keccak):
+    __slots__ = ()
+
+    name = "sha3_224"
+    _block_size = 144
+    _digest_size = 28
+    _domain = 0x06
+    _compress = staticmethod(_generate_compress(144))
+
+
+class SHA3_256(_Keccak):
+    __slots__ = ()
+
+    name = "sha3_256"
+    _block_size = 136
+    _digest_size = 32
+    _domain = 0x06
+    _compress = staticmethod(_generate_compress(136))
+
+
+class SHA3_384(_Keccak):
+    __slots__ = ()
+
+    name = "sha3_384"
+    _block_size = 104
+    _digest_size = 48
+    _domain = 0x06
+    _compress = staticmethod(_generate_compress(104))
+
+
+class SHA3_512(_Keccak):
+    __slots__ = ()
+
+    name = "sha3_512"
+    _block_size = 72
+    _digest_size = 64
+    _domain = 0x06
+    _compress = staticmethod(_generate_compress(72))
+
+
+class SHAKE128(_SHAKE):
+    __slots__ = ()
+
+    name = "shake_128"
+    _block_size = 168
+    _digest_size = 0
+    _domain = 0x1F
+    _compress = staticmethod(_generate_compress(168))
+
+
+class SHAKE256(_SHAKE):
+    __slots__ = ()
+
+    name = "shake_256"
+    _block_size = 136
+    _digest_size = 0
+    _domain = 0x1F
+    _compress = staticmethod(_generate_compress(136))
+
+
+def sha3_224_many(messages: Iterable[ReadableBuffer]) -> list[bytes]:
+    return hash_many(SHA3_224, messages)
+
+
+def sha3_256_many(messages: Iterable[ReadableBuffer]) -> list[bytes]:
+    return hash_many(SHA3_256, messages)
+
+
+def sha3_384_many(messages: Iterable[ReadableBuffer]) -> list[bytes]:
+    return hash_many(SHA3_384, messages)
+
+
+def sha3_512_many(messages: Iterable[ReadableBuffer]) -> list[bytes]:
+    return hash_many(SHA3_512, messages)
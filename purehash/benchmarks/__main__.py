@@ -0,0 +1,3 @@
+from purehash.benchmarks.suite import main
+
+main()
@@ -0,0 +1,193 @@
+from __future__ import annotations
+from argparse import ArgumentParser
+import hashlib
+import json
+import platform
+import sys
+from time import perf_counter
+from typing import Any, Callable
+
+from purehash._common import Hash
+from purehash._registry import lookup
+
+DEFAULT_ALGORITHMS: tuple[str, ...] = ("md5", "sha1", "sha256", "sha512")
+DEFAULT_SIZES: tuple[int, ...] = (64, 1024, 16384, 262144)
+DEFAULT_CHUNK_SIZE: int = 4096
+DEFAULT_MIN_TIME: float = 0.2
+DEFAULT_REPEAT: int = 3
+
+
+def measure(function: Callable[[], Any], min_time: float, repeat: int) -> float:
+    # Best seconds per call, doubling the number of calls until a run is long
+    # enough for the timer resolution not to matter.
+    calls: int = 1
+    while True:
+        start: float = perf_counter()
+        for _ in range(calls):
+            function()
+        elapsed: float = perf_counter() - start
+
+        if elapsed >= min_time:
+            break
+
+        calls *= 2
+
+    best: float = elapsed
+    for _ in range(repeat - 1):
+        start = perf_counter()
+        for _ in range(calls):
+            function()
+        best = min(best, perf_counter() - start)
+
+    return best / calls
+
+
+def _result(
+    algorithm: str,
+    implementation: str,
+    api: str,
+    size: int,
+    block_size: int,
+    seconds: float,
+    **extra: Any,
+) -> dict[str, Any]:
+    return {
+        "algorithm": algorithm,
+        "implementation": implementation,
+        "api": api,
+        "size": size,
+        "seconds": seconds,
+        "mb_per_s": size / seconds / 1e6 if size else None,
+        "ns_per_block": seconds * 1e9 / max(1, -(-size // block_size)),
+        **extra,
+    }
+
+
+def _chunked(
+    algorithm: type[Hash], message: bytes, chunk_size: int
+) -> Callable[[], Any]:
+    view: memoryview = memoryview(message)
+
+    def function() -> None:
+        hash_: Hash = algorithm()
+        for i in range(0, len(view), chunk_size):
+            hash_.update(view[i : i + chunk_size])
+
+    return function
+
+
+def _digest(algorithm: type[Hash], message: bytes) -> Callable[[], Any]:
+    # A new object each time, so the cached digest is never returned.
+    hash_: Hash = algorithm(message)
+
+    return lambda: hash_.copy().digest()
+
+
+def run(
+    algorithms: tuple[str, ...] = DEFAULT_ALGORITHMS,
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    min_time: float = DEFAULT_MIN_TIME,
+    repeat: int = DEFAULT_REPEAT,
+    baseline: bool = True,
+) -> dict[str, Any]:
+    results: list[dict[str, Any]] = []
+
+    name: str
+    for name in algorithms:
+        algorithm: type[Hash] = lookup(name, fixed_size=True)
+        block_size: int = algorithm._block_size
+
+        size: int
+        for size in sizes:
+            message: bytes = bytes(size)
+
+            results.append(
+                _result(
+                    name,
+                    "purehash",
+                    "oneshot",
+                    size,
+                    block_size,
+                    measure(lambda: algorithm(message).digest(), min_time, repeat),
+                )
+            )
+            results.append(
+                _result(
+                    name,
+                    "purehash",
+                    "chunked",
+                    size,
+                    block_size,
+                    measure(_chunked(algorithm, message, chunk_size), min_time, repeat),
+                    chunk_size=chunk_size,
+                )
+            )
+
+            if baseline:
+                results.append(
+                    _result(
+                        name,
+                        "hashlib",
+                        "oneshot",
+                        size,
+                        block_size,
+                        measure(
+                            lambda: hashlib.new(name, message).digest(),
+                            min_time,
+                            repeat,
+                        ),
+                    )
+                )
+
+        # Latency of finalising with a partial block of every interesting length.
+        buffered: int
+        for buffered in (0, block_size - block_size // 8 - 1, block_size - 1):
+            results.append(
+                _result(
+                    name,
+                    "purehash",
+                    "digest",
+                    0,
+                    block_size,
+                    measure(_digest(algorithm, bytes(buffered)), min_time, repeat),
+                    buffered=buffered,
+                )
+            )
+
+    return {
+        "python": platform.python_implementation() + " " + platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(
+        prog="python -m purehash.benchmarks",
+        description="Benchmark purehash and emit the results as JSON.",
+    )
+    parser.add_argument("--algorithm", action="append", dest="algorithms")
+    parser.add_argument("--size", action="append", dest="sizes", type=int)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--no-baseline", action="store_false", dest="baseline")
+    parser.add_argument("--output", "-o", help="Write to a file instead of stdout.")
+    arguments: Any = parser.parse_args()
+
+    report: dict[str, Any] = run(
+        tuple(arguments.algorithms or DEFAULT_ALGORITHMS),
+        tuple(arguments.sizes or DEFAULT_SIZES),
+        arguments.chunk_size,
+        arguments.min_time,
+        arguments.repeat,
+        arguments.baseline,
+    )
+    output: str = json.dumps(report, indent=2, sort_keys=True) + "\n"
+
+    if arguments.output is None:
+        sys.stdout.write(output)
+    else:
+        with open(arguments.output, "w") as file:
+            file.write(output)
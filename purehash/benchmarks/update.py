@@ -0,0 +1,42 @@
+from __future__ import annotations
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Any
+
+from purehash._registry import ALGORITHMS, lookup
+
+KIB: int = 1024
+MIB: int = 1024 * KIB
+
+
+def throughput(algorithm: Any, size: int) -> float:
+    message: bytes = bytes(size)
+
+    start: float = perf_counter()
+    algorithm().update(message)
+    elapsed: float = perf_counter() - start
+
+    return size / elapsed / MIB
+
+
+def main() -> None:
+    parser: ArgumentParser = ArgumentParser(
+        description="Measure single-call update() throughput across message sizes."
+    )
+    parser.add_argument("--min-size", type=int, default=KIB)
+    parser.add_argument("--max-size", type=int, default=64 * MIB)
+    parser.add_argument(
+        "--algorithm", choices=ALGORITHMS, action="append", dest="algorithms"
+    )
+    arguments: Any = parser.parse_args()
+
+    name: str
+    for name in arguments.algorithms or ALGORITHMS:
+        size: int = arguments.min_size
+        while size <= arguments.max_size:
+            print(f"{name:8} {size:>12} B {throughput(lookup(name), size):10.3f} MiB/s")
+            size *= 4
+
+
+if __name__ == "__main__":
+    main()
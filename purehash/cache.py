@@ -0,0 +1,197 @@
+from __future__ import annotations
+import os
+import sqlite3
+from types import TracebackType
+from typing import Optional, Union
+
+from purehash._common import Hash
+from purehash._file import PathLike, file_digest
+from purehash._registry import lookup, name_of
+
+DEFAULT_MAX_ENTRIES: int = 2**20
+
+# Cache hits are recorded in memory and written back this many at a time, so that
+# a hit does not cost a write transaction.
+TOUCH_BATCH_SIZE: int = 2**10
+
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS digests (
+    path TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    device INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest BLOB NOT NULL,
+    used INTEGER NOT NULL,
+    PRIMARY KEY (path, algorithm)
+);
+CREATE INDEX IF NOT EXISTS digests_used ON digests (used);
+"""
+
+
+def _identity(status: os.stat_result) -> tuple[int, int, int, int]:
+    return status.st_dev, status.st_ino, status.st_size, status.st_mtime_ns
+
+
+class DigestCache:
+    max_entries: int
+    _connection: sqlite3.Connection
+    _used: int
+    _entries: int
+    _touched: dict[tuple[str, str], int]
+
+    def __init__(
+        self, path: PathLike = ":memory:", max_entries: int = DEFAULT_MAX_ENTRIES
+    ) -> None:
+        assert max_entries > 0, "max_entries must be positive."
+
+        self.max_entries = max_entries
+        self._connection = sqlite3.connect(os.fspath(path))
+        self._connection.executescript(SCHEMA)
+
+        # A logical clock for least recently used eviction.
+        (self._used,) = self._connection.execute(
+            "SELECT COALESCE(MAX(used), 0) FROM digests"
+        ).fetchone()
+
+        # Kept in memory, as counting rows scans the whole table.
+        (self._entries,) = self._connection.execute(
+            "SELECT COUNT(*) FROM digests"
+        ).fetchone()
+
+        self._touched = {}
+
+    def __enter__(self) -> DigestCache:
+        return self
+
+    def __exit__(
+        self,
+        exception_type: Optional[type[BaseException]],
+        exception: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._entries
+
+    def close(self) -> None:
+        if self._touched:
+            with self._connection:
+                self._flush()
+
+        self._connection.close()
+
+    def _tick(self) -> int:
+        self._used += 1
+        return self._used
+
+    def _flush(self) -> None:
+        # Writes back the recorded hits. Runs inside the caller's transaction.
+        self._connection.executemany(
+            "UPDATE digests SET used = ? WHERE path = ? AND algorithm = ?",
+            ((used, path, name) for (path, name), used in self._touched.items()),
+        )
+        self._touched.clear()
+
+    def get(
+        self, path: PathLike, algorithm: Union[str, type[Hash]] = "sha256"
+    ) -> Optional[bytes]:
+        path = os.path.abspath(path)
+        name: str = name_of(lookup(algorithm, fixed_size=True))
+
+        row: Optional[tuple[int, int, int, int, bytes]] = self._connection.execute(
+            "SELECT device, inode, size, mtime_ns, digest FROM digests"
+            " WHERE path = ? AND algorithm = ?",
+            (path, name),
+        ).fetchone()
+        if row is None:
+            return None
+
+        status: Optional[os.stat_result]
+        try:
+            status = os.stat(path)
+        except OSError:
+            status = None
+
+        # Any change to the file's metadata, or its removal, invalidates the entry.
+        if status is None or row[:4] != _identity(status):
+            self._touched.pop((path, name), None)
+            with self._connection:
+                self._entries -= self._connection.execute(
+                    "DELETE FROM digests WHERE path = ? AND algorithm = ?",
+                    (path, name),
+                ).rowcount
+
+            return None
+
+        self._touched[(path, name)] = self._tick()
+        if len(self._touched) >= TOUCH_BATCH_SIZE:
+            with self._connection:
+                self._flush()
+
+        return row[4]
+
+    def put(
+        self,
+        path: PathLike,
+        algorithm: Union[str, type[Hash]],
+        digest: bytes,
+        status: Optional[os.stat_result] = None,
+    ) -> None:
+        path = os.path.abspath(path)
+        name: str = name_of(lookup(algorithm, fixed_size=True))
+        self._touched.pop((path, name), None)
+
+        with self._connection:
+            if (
+                self._connection.execute(
+                    "SELECT 1 FROM digests WHERE path = ? AND algorithm = ?",
+                    (path, name),
+                ).fetchone()
+                is None
+            ):
+                self._entries += 1
+
+            self._connection.execute(
+                "INSERT OR REPLACE INTO digests VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    path,
+                    name,
+                    *_identity(status or os.stat(path)),
+                    digest,
+                    self._tick(),
+                ),
+            )
+
+            excess: int = self._entries - self.max_entries
+            if excess > 0:
+                # Eviction must see the latest hits.
+                self._flush()
+                self._entries -= self._connection.execute(
+                    "DELETE FROM digests WHERE rowid IN"
+                    " (SELECT rowid FROM digests ORDER BY used LIMIT ?)",
+                    (excess,),
+                ).rowcount
+
+    def digest(
+        self, path: PathLike, algorithm: Union[str, type[Hash]] = "sha256"
+    ) -> bytes:
+        cached: Optional[bytes] = self.get(path, algorithm)
+        if cached is not None:
+            return cached
+
+        status: os.stat_result = os.stat(path)
+        digest: bytes = file_digest(path, algorithm).digest()
+
+        # Only cache the digest if the file did not change while being hashed.
+        if _identity(os.stat(path)) == _identity(status):
+            self.put(path, algorithm, digest, status)
+
+        return digest
+
+    def hexdigest(
+        self, path: PathLike, algorithm: Union[str, type[Hash]] = "sha256"
+    ) -> str:
+        return self.digest(path, algorithm).hex()
@@ -0,0 +1,145 @@
+from __future__ import annotations
+from itertools import islice
+import os
+from typing import BinaryIO, Iterator, Optional, Union
+
+from purehash._common import Hash
+from purehash._file import PathLike
+from purehash._registry import lookup
+
+DEFAULT_MIN_SIZE: int = 2**11
+DEFAULT_AVG_SIZE: int = 2**13
+DEFAULT_MAX_SIZE: int = 2**16
+DEFAULT_READ_SIZE: int = 2**16
+
+# Cut points are harder to find before the average size and easier after it, which
+# narrows the spread of chunk sizes (FastCDC normalised chunking).
+NORMALISATION: int = 2
+
+FINGERPRINT_MASK: int = 0xFFFFFFFFFFFFFFFF
+
+
+def _splitmix64(seed: int) -> Iterator[int]:
+    while True:
+        seed = (seed + 0x9E3779B97F4A7C15) & FINGERPRINT_MASK
+        z: int = seed
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & FINGERPRINT_MASK
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & FINGERPRINT_MASK
+        yield z ^ (z >> 31)
+
+
+# Random 64-bit values per byte, fixed so that cut points are stable everywhere.
+GEAR: tuple[int, ...] = tuple(islice(_splitmix64(0), 256))
+
+
+def _cut_mask(bits: int) -> int:
+    # Each shift pushes older bytes towards the top of the fingerprint, so the top
+    # bits depend on the most bytes.
+    return ((1 << bits) - 1) << (64 - bits)
+
+
+def _scan(
+    data: memoryview, start: int, end: int, fingerprint: int, mask: int
+) -> tuple[int, int, bool]:
+    # Roll the gear hash over data[start:end], stopping just past the first cut
+    # point. Returns the stopping position, the fingerprint and whether it was a cut.
+    gear: tuple[int, ...] = GEAR
+
+    i: int
+    for i in range(start, end):
+        fingerprint = ((fingerprint << 1) + gear[data[i]]) & FINGERPRINT_MASK
+        if not fingerprint & mask:
+            return i + 1, fingerprint, True
+
+    return end, fingerprint, False
+
+
+def _chunks(
+    file: BinaryIO,
+    algorithm: type[Hash],
+    min_size: int,
+    avg_size: int,
+    max_size: int,
+    read_size: int,
+) -> Iterator[tuple[int, int, bytes]]:
+    bits: int = avg_size.bit_length() - 1
+    mask_small: int = _cut_mask(bits + NORMALISATION)
+    mask_large: int = _cut_mask(max(bits - NORMALISATION, 1))
+
+    buffer: bytearray = bytearray(read_size)
+    data: memoryview = memoryview(buffer)
+
+    # Chunk bytes are fed to the hash straight from the read buffer, which is
+    # reused, so memory is bounded by read_size whatever the chunk sizes.
+    hash_: Hash = algorithm()
+    offset: int = 0
+    length: int = 0
+    fingerprint: int = 0
+
+    while True:
+        end: Optional[int] = file.readinto(buffer)  # type: ignore[attr-defined]
+        if not end:
+            break
+
+        start: int = 0
+        i: int = 0
+        while i < end:
+            # Bytes before min_size can never be a cut point, so are not scanned.
+            if length < min_size:
+                step: int = min(min_size - length, end - i)
+                i += step
+                length += step
+                continue
+
+            cut: bool
+            position: int
+            if length < avg_size:
+                position, fingerprint, cut = _scan(
+                    data, i, min(end, i + avg_size - length), fingerprint, mask_small
+                )
+            else:
+                position, fingerprint, cut = _scan(
+                    data, i, min(end, i + max_size - length), fingerprint, mask_large
+                )
+
+            length += position - i
+            i = position
+
+            if cut or length == max_size:
+                hash_.update(data[start:i])
+                yield offset, length, hash_.digest()
+
+                hash_ = algorithm()
+                offset += length
+                length = 0
+                fingerprint = 0
+                start = i
+
+        hash_.update(data[start:end])
+
+    if length:
+        yield offset, length, hash_.digest()
+
+
+def chunks(
+    file: Union[PathLike, BinaryIO],
+    min_size: int = DEFAULT_MIN_SIZE,
+    avg_size: int = DEFAULT_AVG_SIZE,
+    max_size: int = DEFAULT_MAX_SIZE,
+    algorithm: Union[str, type[Hash]] = "sha256",
+    read_size: int = DEFAULT_READ_SIZE,
+) -> Iterator[tuple[int, int, bytes]]:
+    # Yields (offset, length, digest) for each content-defined chunk, lazily.
+    assert 0 < min_size <= avg_size <= max_size, "Require 0 < min <= avg <= max."
+    assert avg_size & (avg_size - 1) == 0, "avg_size must be a power of two."
+    assert read_size > 0, "read_size must be positive."
+
+    algorithm_: type[Hash] = lookup(algorithm, fixed_size=True)
+
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb") as file_:
+            yield from _chunks(
+                file_, algorithm_, min_size, avg_size, max_size, read_size
+            )
+    else:
+        yield from _chunks(file, algorithm_, min_size, avg_size, max_size, read_size)
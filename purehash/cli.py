@@ -0,0 +1,226 @@
+from __future__ import annotations
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import re
+import sys
+from typing import Any, Iterable, Iterator, Optional
+
+from purehash._file import file_digest
+from purehash._registry import ALGORITHMS, lookup
+
+DEFAULT_CHUNK_SIZE: int = 2**20
+
+# "<hexdigest>  <name>" in text mode or "<hexdigest> *<name>" in binary mode, with a
+# leading backslash when the name has been escaped.
+CHECK_LINE: re.Pattern[str] = re.compile(r"^(\\?)([0-9a-fA-F]+) [ *](.*)$")
+
+
+class _Algorithms:
+    # Choices for --algorithm, excluding extendable output functions. Membership only
+    # imports the chosen algorithm, so startup does not pay for the others; listing
+    # them, for --help and errors, imports them all.
+    def __contains__(self, name: object) -> bool:
+        return name in ALGORITHMS and not lookup(str(name))._extendable_output
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(sorted(name for name in ALGORITHMS if name in self))
+
+
+def _escape(name: str) -> tuple[str, str]:
+    if "\\" not in name and "\n" not in name and "\r" not in name:
+        return "", name
+
+    return "\\", name.replace("\\", "\\\\").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def _unescape(name: str) -> str:
+    return re.sub(
+        r"\\(.)", lambda match: {"n": "\n", "r": "\r"}.get(match[1], match[1]), name
+    )
+
+
+def _hexdigest(
+    name: str, algorithm: str, chunk_size: int
+) -> tuple[Optional[str], Optional[str]]:
+    # Returns the hexdigest or an error message, so that one unreadable file does
+    # not abort the rest.
+    try:
+        if name == "-":
+            return (
+                file_digest(sys.stdin.buffer, algorithm, chunk_size).hexdigest(),
+                None,
+            )
+
+        return file_digest(name, algorithm, chunk_size).hexdigest(), None
+    except OSError as error:
+        return None, error.strerror or str(error)
+
+
+def _hexdigests(
+    names: list[str], algorithm: str, chunk_size: int, jobs: int
+) -> Iterator[tuple[Optional[str], Optional[str]]]:
+    # Standard input can only be read by this process.
+    if jobs > 1 and "-" not in names and len(names) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            yield from executor.map(
+                _hexdigest, names, repeat(algorithm), repeat(chunk_size)
+            )
+    else:
+        yield from map(_hexdigest, names, repeat(algorithm), repeat(chunk_size))
+
+
+def _lines(names: Iterable[str]) -> Iterator[str]:
+    name: str
+    for name in names:
+        if name == "-":
+            yield from sys.stdin
+            continue
+
+        with open(name) as file:
+            yield from file
+
+
+def _compute(arguments: Any) -> int:
+    status: int = 0
+
+    name: str
+    hexdigest: Optional[str]
+    error: Optional[str]
+    for name, (hexdigest, error) in zip(
+        arguments.files,
+        _hexdigests(
+            arguments.files, arguments.algorithm, arguments.chunk_size, arguments.jobs
+        ),
+    ):
+        if hexdigest is None:
+            print(f"purehash: {name}: {error}", file=sys.stderr)
+            status = 1
+            continue
+
+        prefix: str
+        escaped: str
+        prefix, escaped = _escape(name)
+        print(f"{prefix}{hexdigest} {'*' if arguments.binary else ' '}{escaped}")
+
+    return status
+
+
+def _check(arguments: Any) -> int:
+    entries: list[tuple[str, str]] = []
+    malformed: int = 0
+
+    try:
+        line: str
+        for line in _lines(arguments.files):
+            match: Optional[re.Match[str]] = CHECK_LINE.match(line.rstrip("\r\n"))
+            if match is None:
+                malformed += 1
+                continue
+
+            name: str = _unescape(match[3]) if match[1] else match[3]
+            entries.append((name, match[2].lower()))
+    except OSError as error:
+        print(f"purehash: {error.filename}: {error.strerror}", file=sys.stderr)
+        return 1
+
+    failed: int = 0
+    unreadable: int = 0
+
+    expected: str
+    hexdigest: Optional[str]
+    error_: Optional[str]
+    for (name, expected), (hexdigest, error_) in zip(
+        entries,
+        _hexdigests(
+            [name for name, _ in entries],
+            arguments.algorithm,
+            arguments.chunk_size,
+            arguments.jobs,
+        ),
+    ):
+        result: str
+        if hexdigest is None:
+            unreadable += 1
+            result = "FAILED open or read"
+            if not arguments.status:
+                print(f"purehash: {name}: {error_}", file=sys.stderr)
+        elif hexdigest != expected:
+            failed += 1
+            result = "FAILED"
+        elif arguments.quiet or arguments.status:
+            continue
+        else:
+            result = "OK"
+
+        if not arguments.status:
+            print(f"{name}: {result}")
+
+    if not arguments.status:
+        count: int
+        singular: str
+        plural: str
+        for count, singular, plural in (
+            (
+                malformed,
+                "line is improperly formatted",
+                "lines are improperly formatted",
+            ),
+            (
+                unreadable,
+                "listed file could not be read",
+                "listed files could not be read",
+            ),
+            (
+                failed,
+                "computed checksum did NOT match",
+                "computed checksums did NOT match",
+            ),
+        ):
+            if count:
+                print(
+                    f"purehash: WARNING: {count} {singular if count == 1 else plural}",
+                    file=sys.stderr,
+                )
+
+    if not entries:
+        print("purehash: no properly formatted checksum lines found", file=sys.stderr)
+        return 1
+
+    return 1 if failed or unreadable else 0
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser: ArgumentParser = ArgumentParser(
+        prog="purehash",
+        description="Print or check checksums in md5sum/sha*sum format.",
+    )
+    parser.add_argument("files", nargs="*", default=["-"], metavar="FILE")
+    parser.add_argument(
+        "-a",
+        "--algorithm",
+        choices=_Algorithms(),
+        default="sha256",
+        metavar="NAME",
+        help="One of %(choices)s.",
+    )
+    parser.add_argument(
+        "-c", "--check", action="store_true", help="Read checksums and check them."
+    )
+    parser.add_argument(
+        "-b", "--binary", action="store_true", help="Mark files as read in binary."
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=1, metavar="N")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument(
+        "--quiet", action="store_true", help="Do not print OK for each file."
+    )
+    parser.add_argument(
+        "--status", action="store_true", help="Print nothing, only set the exit code."
+    )
+    arguments: Any = parser.parse_args(argv)
+
+    if arguments.check:
+        return _check(arguments)
+
+    return _compute(arguments)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+from collections import OrderedDict
+import threading
+from typing import Optional, Union
+
+from purehash._common import Hash
+from purehash._registry import lookup
+from purehash._util import ReadableBuffer
+
+MIDSTATE_CACHE_SIZE: int = 128
+
+TRANSLATE_INNER: bytes = bytes(x ^ 0x36 for x in range(256))
+TRANSLATE_OUTER: bytes = bytes(x ^ 0x5C for x in range(256))
+
+_midstate_cache: OrderedDict[tuple[type[Hash], bytes], tuple[Hash, Hash]] = (
+    OrderedDict()
+)
+_midstate_lock: threading.Lock = threading.Lock()
+
+
+def _compute_midstates(algorithm: type[Hash], key: bytes) -> tuple[Hash, Hash]:
+    # The inner and outer hashes after compressing the padded key.
+    block_size: int = algorithm._block_size
+
+    if len(key) > block_size:
+        key = algorithm(key).digest()
+
+    key = key.ljust(block_size, b"\x00")
+
+    return (
+        algorithm(key.translate(TRANSLATE_INNER)),
+        algorithm(key.translate(TRANSLATE_OUTER)),
+    )
+
+
+def _midstates(algorithm: type[Hash], key: bytes) -> tuple[Hash, Hash]:
+    # Cached midstates are shared between calls, so must be copied rather than
+    # updated directly.
+    cache_key: tuple[type[Hash], bytes] = (algorithm, key)
+
+    # Another thread may evict the key between the lookup and the reordering, so
+    # both happen under the lock. The midstates are computed outside it.
+    midstates: Optional[tuple[Hash, Hash]]
+    with _midstate_lock:
+        midstates = _midstate_cache.get(cache_key)
+        if midstates is not None:
+            _midstate_cache.move_to_end(cache_key)
+            return midstates
+
+    midstates = _compute_midstates(algorithm, key)
+
+    with _midstate_lock:
+        _midstate_cache[cache_key] = midstates
+        if len(_midstate_cache) > MIDSTATE_CACHE_SIZE:
+            _midstate_cache.popitem(last=False)
+
+    return midstates
+
+
+class HMAC:
+    __slots__ = ("_inner", "_outer")
+
+    _inner: Hash
+    _outer: Hash
+
+    def __init__(
+        self,
+        key: ReadableBuffer,
+        msg: ReadableBuffer = b"",
+        digestmod: Union[str, type[Hash]] = "sha256",
+    ) -> None:
+        inner: Hash
+        inner, self._outer = _midstates(lookup(digestmod, fixed_size=True), bytes(key))
+
+        self._inner = inner.copy()
+        self._inner.update(msg)
+
+    @property
+    def name(self) -> str:
+        return f"hmac-{self._inner.name}"
+
+    @property
+    def digest_size(self) -> int:
+        return self._inner.digest_size
+
+    @property
+    def block_size(self) -> int:
+        return self._inner.block_size
+
+    def update(self, msg: ReadableBuffer) -> None:
+        self._inner.update(msg)
+
+    def digest(self) -> bytes:
+        outer: Hash = self._outer.copy()
+        outer.update(self._inner.digest())
+
+        return outer.digest()
+
+    def hexdigest(self) -> str:
+        return self.digest().hex()
+
+    def copy(self) -> HMAC:
+        copy_: HMAC = HMAC.__new__(HMAC)
+        copy_._inner = self._inner.copy()
+        copy_._outer = self._outer
+
+        return copy_
+
+
+def new(
+    key: ReadableBuffer,
+    msg: Optional[ReadableBuffer] = None,
+    digestmod: Union[str, type[Hash]] = "sha256",
+) -> HMAC:
+    return HMAC(key, b"" if msg is None else msg, digestmod)
+
+
+def digest(
+    key: ReadableBuffer, msg: ReadableBuffer, digest: Union[str, type[Hash]]
+) -> bytes:
+    return HMAC(key, msg, digest).digest()
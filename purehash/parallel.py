@@ -0,0 +1,57 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import os
+from typing import Iterable, Optional, Union
+
+from purehash._common import Hash
+from purehash._file import DEFAULT_CHUNK_SIZE, PathLike, file_digest
+from purehash._registry import lookup
+
+
+def _hash_file(path: str, algorithm: Union[str, type[Hash]], chunk_size: int) -> str:
+    return file_digest(path, algorithm, chunk_size).hexdigest()
+
+
+def _expand(paths: Union[PathLike, Iterable[PathLike]]) -> list[str]:
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+
+    result: list[str] = []
+
+    path: PathLike
+    for path in paths:
+        path = os.fspath(path)
+
+        if not os.path.isdir(path):
+            result.append(path)
+            continue
+
+        root: str
+        directories: list[str]
+        files: list[str]
+        for root, directories, files in os.walk(path):
+            directories.sort()
+            result += (os.path.join(root, file) for file in sorted(files))
+
+    return result
+
+
+def hash_files(
+    paths: Union[PathLike, Iterable[PathLike]],
+    algorithm: Union[str, type[Hash]] = "sha256",
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> dict[str, str]:
+    assert chunk_size > 0, "chunk_size must be positive."
+
+    lookup(algorithm, fixed_size=True)  # Fail early on unsupported algorithms.
+    paths_: list[str] = _expand(paths)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return dict(
+            zip(
+                paths_,
+                executor.map(_hash_file, paths_, repeat(algorithm), repeat(chunk_size)),
+            )
+        )
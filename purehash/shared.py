@@ -0,0 +1,135 @@
+from __future__ import annotations
+import threading
+from types import TracebackType
+from typing import Optional, Union
+
+from purehash._common import Hash
+from purehash._registry import lookup
+from purehash._util import ReadableBuffer
+
+DEFAULT_MAX_PENDING: int = 2**24
+
+
+class SharedHasher:
+    _hash: Hash
+    _max_pending: int
+    _pending: dict[int, bytes]
+    _pending_bytes: int
+    _next: int
+    _closed: bool
+    _error: Optional[BaseException]
+    _condition: threading.Condition
+    _consumer: threading.Thread
+
+    def __init__(
+        self,
+        algorithm: Union[str, type[Hash]] = "sha256",
+        max_pending: int = DEFAULT_MAX_PENDING,
+        first_sequence: int = 0,
+    ) -> None:
+        assert max_pending > 0, "max_pending must be positive."
+
+        self._hash = lookup(algorithm, fixed_size=True)()
+        self._max_pending = max_pending
+        self._pending = {}
+        self._pending_bytes = 0
+        self._next = first_sequence
+        self._closed = False
+        self._error = None
+        self._condition = threading.Condition()
+
+        # The only thread that touches the hash, so update() needs no locking.
+        self._consumer = threading.Thread(target=self._consume, daemon=True)
+        self._consumer.start()
+
+    def _consume(self) -> None:
+        while True:
+            with self._condition:
+                while self._next not in self._pending and not self._closed:
+                    self._condition.wait()
+
+                segment: Optional[bytes] = self._pending.pop(self._next, None)
+                if segment is None:
+                    return
+
+                # Advanced as the segment is taken, so that it cannot be submitted
+                # again while it is being compressed.
+                self._next += 1
+
+            # Compress outside the lock, so producers can keep submitting.
+            try:
+                self._hash.update(segment)
+            except BaseException as error:
+                # Surfaced from submit() and close(), rather than lost with the thread.
+                with self._condition:
+                    self._error = error
+                    self._closed = True
+                    self._condition.notify_all()
+
+                return
+
+            with self._condition:
+                self._pending_bytes -= len(segment)
+                self._condition.notify_all()
+
+    def submit(self, sequence: int, data: ReadableBuffer) -> None:
+        # Compression happens later, so take a copy unless data is immutable.
+        segment: bytes = data if isinstance(data, bytes) else bytes(data)
+
+        with self._condition:
+            # Blocks only while too many bytes are waiting. The next expected segment
+            # is always admitted, otherwise a full queue could never drain. This
+            # cannot deadlock as long as each producer submits its own segments in
+            # increasing order.
+            while (
+                sequence != self._next
+                and self._pending_bytes + len(segment) > self._max_pending
+                and not self._closed
+            ):
+                self._condition.wait()
+
+            if self._error is not None:
+                raise self._error
+
+            if self._closed:
+                raise ValueError("Cannot submit to a closed SharedHasher.")
+
+            if sequence < self._next or sequence in self._pending:
+                raise ValueError(f"Segment {sequence} was already submitted.")
+
+            self._pending[sequence] = segment
+            self._pending_bytes += len(segment)
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        # Waits for every submitted segment to be compressed.
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+        self._consumer.join()
+
+        if self._error is not None:
+            raise self._error
+
+        if self._pending:
+            raise ValueError(f"Segment {self._next} was never submitted.")
+
+    def digest(self) -> bytes:
+        self.close()
+
+        return self._hash.digest()
+
+    def hexdigest(self) -> str:
+        return self.digest().hex()
+
+    def __enter__(self) -> SharedHasher:
+        return self
+
+    def __exit__(
+        self,
+        exception_type: Optional[type[BaseException]],
+        exception: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -0,0 +1,39 @@
+import asyncio
+from hashlib import sha256, sha512
+from random import getrandbits
+
+from purehash.aio import AsyncHasher, hash_stream
+
+
+def test_hash_stream():
+    data = bytes(getrandbits(8) for _ in range(5000))
+
+    async def chunks():
+        for i in range(0, len(data), 333):
+            yield data[i : i + 333]
+
+    async def main():
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+
+        x = await hash_stream(reader, chunk_size=1000, block_budget=3)
+        assert x.digest() == sha256(data).digest()
+
+        y = await hash_stream(chunks(), "sha512", max_in_flight=1, block_budget=1)
+        assert y.digest() == sha512(data).digest()
+
+    asyncio.run(main())
+
+
+def test_async_hasher():
+    data = bytearray(getrandbits(8) for _ in range(1000))
+    expected = sha256(data).hexdigest()
+
+    async def main():
+        hasher = AsyncHasher(block_budget=2)
+        await hasher.update(data)
+        data[:] = bytes(len(data))  # Pending slices must not see later changes.
+        assert await hasher.hexdigest() == expected
+
+    asyncio.run(main())
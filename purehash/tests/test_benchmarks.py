@@ -0,0 +1,13 @@
+import json
+
+from purehash.benchmarks.suite import run
+
+
+def test_run():
+    report = run(("md5", "sha512"), (0, 200), chunk_size=64, min_time=0, repeat=1)
+    json.dumps(report)
+
+    apis = {(r["algorithm"], r["implementation"], r["api"]) for r in report["results"]}
+    assert ("md5", "purehash", "chunked") in apis
+    assert ("sha512", "hashlib", "oneshot") in apis
+    assert ("sha512", "purehash", "digest") in apis
@@ -0,0 +1,67 @@
+from hashlib import sha256
+import os
+
+from purehash import cache
+from purehash.cache import DigestCache
+
+
+def test_digest_cache(tmp_path, monkeypatch):
+    paths = [tmp_path / name for name in "abc"]
+    for path in paths:
+        path.write_bytes(path.name.encode() * 100)
+
+    with DigestCache(tmp_path / "cache.sqlite", max_entries=2) as digest_cache:
+        assert digest_cache.digest(paths[0]) == sha256(b"a" * 100).digest()
+        assert digest_cache.hexdigest(paths[1]) == sha256(b"b" * 100).hexdigest()
+
+    def fail(*args):
+        raise AssertionError("File was read.")
+
+    with DigestCache(tmp_path / "cache.sqlite", max_entries=2) as digest_cache:
+        with monkeypatch.context() as context:
+            context.setattr(cache, "file_digest", fail)
+            assert digest_cache.digest(paths[0]) == sha256(b"a" * 100).digest()
+
+        # Modified files are rehashed.
+        paths[0].write_bytes(b"changed")
+        os.utime(paths[0], ns=(0, 0))
+        assert digest_cache.digest(paths[0]) == sha256(b"changed").digest()
+
+        # paths[1] is the least recently used, so is evicted.
+        digest_cache.digest(paths[2])
+        assert len(digest_cache) == 2
+        assert digest_cache.get(paths[1]) is None
+        assert digest_cache.get(paths[2]) == sha256(b"c" * 100).digest()
+
+        # Deleted files drop their entry rather than raising.
+        paths[2].unlink()
+        assert digest_cache.get(paths[2]) is None
+        assert len(digest_cache) == 1
+
+        # Replacing an entry does not change the count.
+        digest_cache.put(paths[0], "sha256", b"digest")
+        assert len(digest_cache) == 1
+
+    with DigestCache(tmp_path / "cache.sqlite", max_entries=2) as digest_cache:
+        assert len(digest_cache) == 1
+
+
+def test_digest_cache_hits(tmp_path):
+    paths = [tmp_path / name for name in "abc"]
+    for path in paths:
+        path.write_bytes(path.name.encode() * 100)
+
+    with DigestCache(tmp_path / "cache.sqlite", max_entries=2) as digest_cache:
+        digest_cache.digest(paths[0])
+        digest_cache.digest(paths[1])
+
+        # Hits are not written until the cache is closed, or needs to evict.
+        changes = digest_cache._connection.total_changes
+        assert digest_cache.get(paths[0]) is not None
+        assert digest_cache._connection.total_changes == changes
+
+    with DigestCache(tmp_path / "cache.sqlite", max_entries=2) as digest_cache:
+        # The hit on paths[0] survived closing, so paths[1] is evicted.
+        digest_cache.digest(paths[2])
+        assert digest_cache.get(paths[0]) is not None
+        assert digest_cache.get(paths[1]) is None
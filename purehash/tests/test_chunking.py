@@ -0,0 +1,39 @@
+from hashlib import sha256
+import io
+from random import Random
+
+from purehash.chunking import chunks
+
+
+def test_chunks(tmp_path):
+    # Fixed data, so that the insertion check below is deterministic.
+    random = Random(0)
+    data = bytes(random.getrandbits(8) for _ in range(20000))
+    path = tmp_path / "data"
+    path.write_bytes(data)
+
+    records = list(chunks(path, 64, 256, 1024))
+
+    offset = 0
+    for offset_, length, digest in records:
+        assert offset_ == offset
+        assert 64 <= length <= 1024 or offset_ + length == len(data)
+        assert digest == sha256(data[offset : offset + length]).digest()
+        offset += length
+
+    assert offset == len(data)
+
+    for read_size in (1, 100, 4096):
+        assert (
+            list(chunks(io.BytesIO(data), 64, 256, 1024, read_size=read_size))
+            == records
+        )
+
+    # Cut points depend on content, so an insertion only disturbs the chunks until
+    # the cut points line up again. Most chunks are unchanged.
+    shifted = {
+        digest for _, _, digest in chunks(io.BytesIO(b"x" + data), 64, 256, 1024)
+    }
+    assert len(shifted & {digest for _, _, digest in records}) >= len(records) * 3 // 4
+
+    assert list(chunks(io.BytesIO(b""))) == []
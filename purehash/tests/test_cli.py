@@ -0,0 +1,61 @@
+from hashlib import md5, sha256
+
+import pytest
+
+from purehash.cli import main
+
+
+def test_compute(tmp_path, capsys):
+    paths = [tmp_path / "a", tmp_path / "b\\c"]
+    for path in paths:
+        path.write_bytes(path.name.encode() * 100)
+
+    # Names containing a backslash are escaped, as md5sum and friends do.
+    escaped = str(paths[1]).replace("\\", "\\\\")
+    digest = sha256(paths[1].read_bytes()).hexdigest()
+    assert main([str(path) for path in paths]) == 0
+    assert capsys.readouterr().out == (
+        f"{sha256(b'a' * 100).hexdigest()}  {paths[0]}\n" f"\\{digest}  {escaped}\n"
+    )
+
+    assert main(["-a", "md5", "--jobs", "2", "-b", str(paths[0]), str(paths[0])]) == 0
+    line = f"{md5(b'a' * 100).hexdigest()} *{paths[0]}\n"
+    assert capsys.readouterr().out == line * 2
+
+    assert main([str(tmp_path / "missing")]) == 1
+    assert "No such file" in capsys.readouterr().err
+
+
+def test_check(tmp_path, capsys):
+    paths = [tmp_path / "a", tmp_path / "b\\c"]
+    for path in paths:
+        path.write_bytes(path.name.encode() * 100)
+
+    main([str(path) for path in paths])
+    sums = tmp_path / "SHA256SUMS"
+    sums.write_text(capsys.readouterr().out)
+
+    assert main(["-c", "-j", "2", str(sums)]) == 0
+    assert capsys.readouterr().out == "".join(f"{path}: OK\n" for path in paths)
+
+    paths[0].write_bytes(b"changed")
+    assert main(["-c", "--quiet", str(sums)]) == 1
+    captured = capsys.readouterr()
+    assert captured.out == f"{paths[0]}: FAILED\n"
+    assert "1 computed checksum did NOT match" in captured.err
+
+    assert main(["-c", "--status", str(sums)]) == 1
+    assert capsys.readouterr() == ("", "")
+
+
+def test_algorithms(capsys):
+    # Extendable output functions have no fixed digest, so are not offered.
+    with pytest.raises(SystemExit):
+        main(["--help"])
+    help_ = capsys.readouterr().out
+    assert "sha3_256" in help_
+    assert "shake" not in help_
+
+    with pytest.raises(SystemExit):
+        main(["-a", "shake_128"])
+    assert "invalid choice: 'shake_128'" in capsys.readouterr().err
@@ -0,0 +1,101 @@
+from hashlib import md5, sha1, sha256, sha512
+from random import getrandbits
+
+import pytest
+
+from purehash.algorithms._md5 import MD5, md5_many
+from purehash.algorithms._sha1 import SHA1, sha1_many
+from purehash.algorithms._sha2 import SHA256, SHA512, sha256_many, sha512_many
+
+PAIRS = ((md5, MD5), (sha1, SHA1), (sha256, SHA256), (sha512, SHA512))
+
+
+def test_large_update():
+    message = bytes(getrandbits(8) for _ in range(4099))
+
+    for x, y in PAIRS:
+        assert x(message).digest() == y(message).digest()
+        assert x(message).digest() == y(bytearray(message)).digest()
+        assert x(message).digest() == y(memoryview(message)).digest()
+
+
+def test_partial_then_large_update():
+    message = bytes(getrandbits(8) for _ in range(4099))
+
+    for x, y in PAIRS:
+        for split in (1, 63, 64, 65, 127, 128, 129):
+            y_ = y(message[:split])
+            y_.update(memoryview(message)[split:])
+            assert x(message).digest() == y_.digest()
+
+
+def test_hash_many():
+    messages = [bytes(getrandbits(8) for _ in range(i)) for i in range(0, 260, 3)]
+
+    for (x, _), y in zip(PAIRS, (md5_many, sha1_many, sha256_many, sha512_many)):
+        assert y(messages) == [x(message).digest() for message in messages]
+        assert y(iter(messages)) == y(map(bytearray, messages))
+
+
+def test_copy_and_state():
+    prefix = bytes(getrandbits(8) for _ in range(200))
+
+    for x, y in PAIRS:
+        for split in (0, 1, 64, 130, 200):
+            y_ = y(prefix[:split])
+            copy = y_.copy()
+            restored = y.from_state(y_.get_state())
+
+            y_.update(b"suffix")
+            assert copy.digest() == x(prefix[:split]).digest()
+            assert restored.digest() == x(prefix[:split]).digest()
+
+            copy.update(b"suffix")
+            restored.update(b"suffix")
+            assert copy.digest() == restored.digest() == y_.digest()
+
+        with pytest.raises(ValueError):
+            y.from_state(y_.get_state()[:5])
+
+
+def test_chaining_values():
+    message = bytes(getrandbits(8) for _ in range(1000))
+
+    for x, y in PAIRS:
+        y_ = y(message[:300])
+        values, byte_count = y_.get_chaining_values()
+        assert byte_count == 300 - 300 % y._block_size
+
+        for values_ in (values, bytearray(values), y_._state):
+            resumed = y.from_chaining_values(values_, byte_count)
+            resumed.update(memoryview(message)[byte_count:])
+            assert resumed.digest() == x(message).digest()
+
+        with pytest.raises(ValueError):
+            y.from_chaining_values(values, byte_count + 1)
+
+        with pytest.raises(ValueError):
+            y.from_chaining_values(values[:-1], byte_count)
+
+        with pytest.raises(ValueError):
+            y.from_chaining_values([-1] * len(y_._state), byte_count)
+
+
+def test_digest_is_non_destructive():
+    for x, y in PAIRS:
+        y_ = y(b"a" * 100)
+        state = y_.get_state()
+
+        assert y_.digest() == y_.digest() == x(b"a" * 100).digest()
+        assert y_.get_state() == state
+
+        y_.update(b"")
+        assert y_.digest() == x(b"a" * 100).digest()
+
+        y_.update(b"b")
+        assert y_.digest() == x(b"a" * 100 + b"b").digest()
+
+
+def test_slots():
+    for _, y in PAIRS:
+        assert not hasattr(y(), "__dict__")
@@ -0,0 +1,60 @@
+from hashlib import sha256, sha512
+import io
+import mmap
+import os
+from random import getrandbits
+
+from purehash import file_digest
+
+
+def test_file_digest(tmp_path):
+    data = bytes(getrandbits(8) for _ in range(5000))
+    path = tmp_path / "data"
+    path.write_bytes(data)
+
+    assert file_digest(path, "sha256").digest() == sha256(data).digest()
+    assert file_digest(str(path), "sha512").digest() == sha512(data).digest()
+
+    with open(path, "rb") as file:
+        file.seek(123)
+        assert file_digest(file, "sha256").digest() == sha256(data[123:]).digest()
+        assert file.read() == b""
+
+    empty = tmp_path / "empty"
+    empty.write_bytes(b"")
+    assert file_digest(empty, "sha256").digest() == sha256().digest()
+
+
+def test_file_digest_readinto():
+    data = bytes(getrandbits(8) for _ in range(5000))
+    assert (
+        file_digest(io.BytesIO(data), "sha256", chunk_size=100).digest()
+        == sha256(data).digest()
+    )
+
+    read, write = os.pipe()
+    os.write(write, data)
+    os.close(write)
+    with os.fdopen(read, "rb") as file:
+        assert file_digest(file, "sha256").digest() == sha256(data).digest()
+
+
+def test_file_digest_unmappable(tmp_path, monkeypatch):
+    # Files in procfs report a size of zero despite having content.
+    if os.path.exists("/proc/self/cmdline"):
+        with open("/proc/self/cmdline", "rb") as file:
+            data = file.read()
+
+        assert file_digest("/proc/self/cmdline", "sha256").digest() == (
+            sha256(data).digest()
+        )
+
+    data = bytes(getrandbits(8) for _ in range(5000))
+    path = tmp_path / "data"
+    path.write_bytes(data)
+
+    def fail(*args, **kwargs):
+        raise OSError(19, "No such device")
+
+    monkeypatch.setattr(mmap, "mmap", fail)
+    assert file_digest(path, "sha256").digest() == sha256(data).digest()
@@ -0,0 +1,58 @@
+import hmac
+from random import getrandbits
+import threading
+
+from purehash import hmac as purehmac
+
+ALGORITHMS = ("md5", "sha1", "sha256", "sha512")
+
+
+def test_hmac():
+    for algorithm in ALGORITHMS:
+        for key_length in (0, 10, 64, 65, 128, 129, 200):
+            key = bytes(getrandbits(8) for _ in range(key_length))
+            message = bytes(getrandbits(8) for _ in range(getrandbits(8)))
+            expected = hmac.new(key, message, algorithm)
+
+            x = purehmac.new(key, message, algorithm)
+            assert x.digest() == expected.digest()
+            assert x.hexdigest() == expected.hexdigest()
+            assert purehmac.digest(key, message, algorithm) == expected.digest()
+
+            y = purehmac.new(key, digestmod=algorithm)
+            y.update(message[:10])
+            z = y.copy()
+            y.update(message[10:])
+            assert y.digest() == expected.digest()
+            assert z.digest() == hmac.new(key, message[:10], algorithm).digest()
+
+
+def test_hmac_default():
+    assert purehmac.new(b"key", b"message").digest() == (
+        hmac.new(b"key", b"message", "sha256").digest()
+    )
+
+
+def test_hmac_threads(monkeypatch):
+    # A tiny cache makes threads constantly evict each other's keys.
+    monkeypatch.setattr(purehmac, "MIDSTATE_CACHE_SIZE", 2)
+    keys = [bytes([i]) * 8 for i in range(8)]
+    errors = []
+
+    def work(offset):
+        try:
+            for i in range(200):
+                key = keys[(i + offset) % len(keys)]
+                assert purehmac.digest(key, b"message", "md5") == hmac.digest(
+                    key, b"message", "md5"
+                )
+        except BaseException as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
@@ -0,0 +1,30 @@
+from hashlib import sha256
+
+import purehash
+from purehash.algorithms._sha2 import SHA256
+
+
+def test_instrumentation():
+    update = SHA256.update
+
+    purehash.set_instrumentation(True)
+    try:
+        assert purehash.is_instrumented()
+        purehash.reset_instrumentation()
+
+        x = purehash.sha256(b"a" * 100)
+        x.update(b"b" * 100)
+        assert x.digest() == sha256(b"a" * 100 + b"b" * 100).digest()
+        assert purehash.sha256_many([b"c"]) == [sha256(b"c").digest()]
+
+        snapshot = purehash.instrumentation_snapshot()["sha256"]
+        assert snapshot["blocks"] == 3 + 1 + 1
+        assert snapshot["bytes"] == 200
+        assert snapshot["digests"] == 1
+        assert snapshot["time"]["compress"] > 0
+    finally:
+        purehash.set_instrumentation(False)
+
+    assert not purehash.is_instrumented()
+    assert SHA256.update is update
+    assert "update" not in SHA256.__dict__
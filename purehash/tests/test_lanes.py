@@ -0,0 +1,28 @@
+from hashlib import md5, sha1, sha224, sha256, sha384, sha512, sha3_256, sha3_512
+from random import getrandbits
+
+import pytest
+
+from purehash.algorithms._md5 import MD5
+from purehash.algorithms._sha1 import SHA1
+from purehash.algorithms._sha2 import SHA224, SHA256, SHA384, SHA512
+from purehash.algorithms._sha3 import SHA3_256, SHA3_512
+from purehash._lanes import hash_lanes
+
+pytest.importorskip("numpy")
+
+
+def test_hash_lanes():
+    for x, y in (
+        (md5, MD5),
+        (sha1, SHA1),
+        (sha224, SHA224),
+        (sha256, SHA256),
+        (sha384, SHA384),
+        (sha512, SHA512),
+        (sha3_256, SHA3_256),
+        (sha3_512, SHA3_512),
+    ):
+        for length in (0, 1, 55, 56, 64, 71, 72, 111, 112, 128, 135, 136, 300):
+            messages = [bytes(getrandbits(8) for _ in range(length)) for _ in range(5)]
+            assert hash_lanes(y, messages) == [x(m).digest() for m in messages]
@@ -0,0 +1,26 @@
+import hashlib
+from random import getrandbits
+
+from purehash import multi
+
+NAMES = ["sha256", "md5", "sha512", "sha1", "sha384"]
+
+
+def test_multi():
+    message = bytes(getrandbits(8) for _ in range(3000))
+    expected = {name: hashlib.new(name, message).hexdigest() for name in NAMES}
+
+    assert list(multi(NAMES, message).hexdigest()) == NAMES
+    assert multi(NAMES, message).hexdigest() == expected
+
+    for split in (1, 63, 64, 65, 127, 128, 129):
+        hash_ = multi(NAMES, message[:split])
+        copy = hash_.copy()
+        hash_.update(memoryview(message)[split:])
+        assert hash_.hexdigest() == expected
+        assert hash_.digest() == hash_.digest()
+
+        copy.update(bytearray(message[split:]))
+        assert copy.hexdigest() == expected
+
+    assert multi(["md5"]).digest() == {"md5": hashlib.md5().digest()}
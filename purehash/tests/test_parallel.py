@@ -0,0 +1,22 @@
+from hashlib import md5, sha256
+from random import getrandbits
+
+from purehash.parallel import hash_files
+
+
+def test_hash_files(tmp_path):
+    contents = {}
+    for name in ("b", "a", "sub/c", "sub/d"):
+        path = tmp_path / name
+        path.parent.mkdir(exist_ok=True)
+        contents[str(path)] = bytes(getrandbits(8) for _ in range(getrandbits(10)))
+        path.write_bytes(contents[str(path)])
+
+    result = hash_files(tmp_path, workers=2, chunk_size=100)
+    assert list(result) == sorted(contents)
+    assert result == {path: sha256(data).hexdigest() for path, data in contents.items()}
+
+    paths = [tmp_path / "sub/d", tmp_path / "a"]
+    result = hash_files(paths, "md5", workers=1)
+    assert list(result) == [str(path) for path in paths]
+    assert result == {str(path): md5(path.read_bytes()).hexdigest() for path in paths}
@@ -0,0 +1,26 @@
+import hashlib
+
+from purehash import hmac, pbkdf2_hmac
+
+
+def test_pbkdf2_hmac():
+    for algorithm in ("md5", "sha1", "sha256", "sha512"):
+        for iterations in (1, 2, 50):
+            for dklen in (None, 1, 16, 100):
+                assert pbkdf2_hmac(
+                    algorithm, b"password", b"salt", iterations, dklen
+                ) == hashlib.pbkdf2_hmac(
+                    algorithm, b"password", b"salt", iterations, dklen
+                )
+
+
+def test_pbkdf2_hmac_workers():
+    assert pbkdf2_hmac(
+        "sha256", b"p" * 100, b"s", 20, 100, workers=2
+    ) == hashlib.pbkdf2_hmac("sha256", b"p" * 100, b"s", 20, 100)
+
+
+def test_pbkdf2_hmac_does_not_cache_password():
+    pbkdf2_hmac("sha256", b"secret password", b"salt", 2)
+
+    assert all(key != b"secret password" for _, key in hmac._midstate_cache)
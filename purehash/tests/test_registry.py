@@ -0,0 +1,71 @@
+import hashlib
+import subprocess
+import sys
+
+import pytest
+
+import purehash
+from purehash import hmac
+from purehash.algorithms._sha3 import _SHAKE
+from purehash.tree import merkle_root
+
+XOFS = {"shake_128": hashlib.shake_128, "shake_256": hashlib.shake_256}
+
+
+def test_new():
+    assert purehash.algorithms_available == purehash.algorithms_guaranteed
+
+    for name in purehash.algorithms_available:
+        x = hashlib.new(name, b"abc")
+        y = purehash.new(name, b"abc")
+        if isinstance(y, _SHAKE):
+            assert y.digest(100) == XOFS[name](b"abc").digest(100)
+        else:
+            assert y.digest() == x.digest()
+        assert (y.name, y.digest_size, y.block_size) == (
+            x.name,
+            x.digest_size,
+            x.block_size,
+        )
+        assert type(y).digest_size == x.digest_size
+
+    assert purehash.new("SHA256").hexdigest() == hashlib.sha256().hexdigest()
+
+    with pytest.raises(ValueError):
+        purehash.new("blake2b")
+
+
+def test_fixed_size_only():
+    # Anything that calls digest() without an output length rejects SHAKE up front.
+    for call in (
+        lambda: purehash.pbkdf2_hmac("shake_128", b"password", b"salt", 1),
+        lambda: hmac.new(b"key", b"message", "shake_256"),
+        lambda: merkle_root(b"data", "shake_128"),
+        lambda: purehash.multi(["sha256", "shake_128"]),
+    ):
+        with pytest.raises(ValueError):
+            call()
+
+
+def test_hmac_metadata():
+    x = hmac.new(b"key", digestmod="sha512")
+    assert (x.name, x.digest_size, x.block_size) == ("hmac-sha512", 64, 128)
+
+
+def test_lazy_import():
+    modules = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, purehash, purehash.hmac; purehash.md5;"
+            " purehash.hmac.new(b'', b'', 'md5');"
+            " print(' '.join(sys.modules))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.split()
+
+    assert "purehash.algorithms._md5" in modules
+    assert "purehash.algorithms._sha2" not in modules
+    assert "numpy" not in modules
@@ -1,12 +1,36 @@
-from hashlib import sha256, sha512
+from functools import partial
+from hashlib import new, sha224, sha256, sha384, sha512
 
-from purehash.algorithms._sha2 import SHA256, SHA512
+from purehash.algorithms._sha2 import (
+    SHA224,
+    SHA256,
+    SHA384,
+    SHA512,
+    SHA512_224,
+    SHA512_256,
+)
 from purehash._util import random_tests
 
 
+def test_sha224():
+    random_tests(sha224, SHA224, (55, 56, 57, 63, 64, 65))
+
+
 def test_sha256():
     random_tests(sha256, SHA256, (55, 56, 57, 63, 64, 65))
 
 
+def test_sha384():
+    random_tests(sha384, SHA384, (111, 112, 113, 127, 128, 129))
+
+
 def test_sha512():
     random_tests(sha512, SHA512, (111, 112, 113, 127, 128, 129))
+
+
+def test_sha512_224():
+    random_tests(partial(new, "sha512_224"), SHA512_224, (111, 112, 113, 127, 128, 129))
+
+
+def test_sha512_256():
+    random_tests(partial(new, "sha512_256"), SHA512_256, (111, 112, 113, 127, 128, 129))
@@ -0,0 +1,56 @@
+from hashlib import pbkdf2_hmac, sha3_224, sha3_256, sha3_384, sha3_512
+from hashlib import shake_128, shake_256
+from random import getrandbits
+
+import purehash
+from purehash.algorithms._sha3 import (
+    SHA3_224,
+    SHA3_256,
+    SHA3_384,
+    SHA3_512,
+    SHAKE128,
+    SHAKE256,
+    sha3_256_many,
+)
+from purehash._util import random_tests
+
+
+def test_sha3_224():
+    random_tests(sha3_224, SHA3_224, (142, 143, 144, 145))
+
+
+def test_sha3_256():
+    random_tests(sha3_256, SHA3_256, (134, 135, 136, 137))
+
+
+def test_sha3_384():
+    random_tests(sha3_384, SHA3_384, (102, 103, 104, 105))
+
+
+def test_sha3_512():
+    random_tests(sha3_512, SHA3_512, (70, 71, 72, 73))
+
+
+def test_shake():
+    for x, y in ((shake_128, SHAKE128), (shake_256, SHAKE256)):
+        for length in (0, 1, 135, 136, 167, 168, 169, 400):
+            message = bytes(getrandbits(8) for _ in range(length))
+            y_ = y(message)
+
+            # Each squeeze reuses the output and state of the last.
+            for output_length in (0, 16, 168, 169, 400, 32):
+                assert y_.digest(output_length) == x(message).digest(output_length)
+
+            copy = y_.copy()
+            y_.update(b"suffix")
+            assert copy.hexdigest(500) == x(message).hexdigest(500)
+            assert y_.hexdigest(500) == x(message + b"suffix").hexdigest(500)
+
+
+def test_sha3_many_and_pbkdf2():
+    messages = [bytes(getrandbits(8) for _ in range(i)) for i in range(0, 300, 7)]
+    assert sha3_256_many(messages) == [sha3_256(m).digest() for m in messages]
+
+    assert purehash.pbkdf2_hmac("sha3_512", b"password", b"salt", 3, 100) == (
+        pbkdf2_hmac("sha3_512", b"password", b"salt", 3, 100)
+    )
@@ -0,0 +1,94 @@
+from hashlib import sha256
+from random import getrandbits, shuffle
+import threading
+
+import pytest
+
+from purehash.algorithms._sha2 import SHA256
+from purehash.shared import SharedHasher
+
+
+def test_shared_hasher():
+    segments = [bytes(getrandbits(8) for _ in range(i * 7)) for i in range(200)]
+    order = list(range(len(segments)))
+    shuffle(order)
+
+    hasher = SharedHasher("sha256", max_pending=1000)
+
+    def produce(sequences):
+        for sequence in sequences:
+            hasher.submit(sequence, bytearray(segments[sequence]))
+
+    # Each producer submits its own segments in order, but they interleave freely.
+    threads = [
+        threading.Thread(target=produce, args=(sorted(order[i::4]),)) for i in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert hasher.digest() == sha256(b"".join(segments)).digest()
+
+    with pytest.raises(ValueError):
+        hasher.submit(len(segments), b"late")
+
+
+def test_shared_hasher_errors():
+    hasher = SharedHasher("md5")
+    hasher.submit(0, b"a")
+
+    with pytest.raises(ValueError):
+        hasher.submit(0, b"a")
+
+    hasher.submit(2, b"c")
+    with pytest.raises(ValueError):
+        hasher.close()
+
+
+def test_shared_hasher_in_flight():
+    started = threading.Event()
+    release = threading.Event()
+
+    class Slow(SHA256):
+        __slots__ = ()
+
+        def update(self, message):
+            if message:
+                started.set()
+                release.wait()
+
+            super().update(message)
+
+    hasher = SharedHasher(Slow)
+    hasher.submit(0, b"a")
+    started.wait()
+
+    # Segment 0 is being compressed, so is neither pending nor complete.
+    with pytest.raises(ValueError):
+        hasher.submit(0, b"a")
+
+    release.set()
+    hasher.submit(1, b"b")
+    assert hasher.digest() == sha256(b"ab").digest()
+
+
+def test_shared_hasher_consumer_error():
+    class Broken(SHA256):
+        __slots__ = ()
+
+        def update(self, message):
+            if message:
+                raise MemoryError
+
+            super().update(message)
+
+    hasher = SharedHasher(Broken, max_pending=1)
+    hasher.submit(0, b"a")
+
+    # Would otherwise wait forever for room, as nothing is consumed.
+    with pytest.raises(MemoryError):
+        hasher.submit(2, b"cc")
+
+    with pytest.raises(MemoryError):
+        hasher.digest()
@@ -0,0 +1,75 @@
+from hashlib import sha256
+from random import getrandbits
+
+import pytest
+
+from purehash.tree import MerkleTree, merkle_root, verify_proof
+
+
+def reference_root(data, leaf_size):
+    level = [
+        sha256(b"\x00" + data[i : i + leaf_size]).digest()
+        for i in range(0, max(len(data), 1), leaf_size)
+    ]
+    while len(level) > 1:
+        parents = [
+            sha256(b"\x01" + level[i] + level[i + 1]).digest()
+            for i in range(0, len(level) - 1, 2)
+        ]
+        level = parents + level[len(parents) * 2 :]
+
+    return level[0]
+
+
+def test_merkle_root():
+    for length in (0, 1, 100, 700, 1000):
+        data = bytes(getrandbits(8) for _ in range(length))
+        assert merkle_root(data, leaf_size=100) == reference_root(data, 100)
+
+
+def test_update(tmp_path):
+    data = bytearray(getrandbits(8) for _ in range(1234))
+    tree = MerkleTree.from_data(data, leaf_size=64)
+
+    data[300:310] = b"x" * 10
+    tree.update(data, 300, 310)
+    assert tree.root == reference_root(bytes(data), 64)
+
+    data += b"tail"
+    tree.update(data, len(data) - 4, len(data))
+    assert tree.root == reference_root(bytes(data), 64)
+
+    path = tmp_path / "data"
+    path.write_bytes(data)
+    assert MerkleTree.from_file(path, leaf_size=64, workers=2).root == tree.root
+
+    tree.save(tmp_path / "index")
+    loaded = MerkleTree.load(tmp_path / "index")
+    assert loaded.root == tree.root
+    assert loaded.leaves == tree.leaves
+
+    index = (tmp_path / "index").read_bytes()
+    for corrupt in (
+        b"XXXX" + index[4:],
+        index[:4],
+        index[:20],
+        index[:-1],
+        index[:-32],
+        index[:5] + b"sha999" + index[11:],
+    ):
+        (tmp_path / "corrupt").write_bytes(corrupt)
+        with pytest.raises(ValueError):
+            MerkleTree.load(tmp_path / "corrupt")
+
+
+def test_proof():
+    data = bytes(getrandbits(8) for _ in range(1000))
+    tree = MerkleTree.from_data(data, "md5", leaf_size=64)
+
+    for index in range(len(tree.leaves)):
+        leaf = data[index * 64 : (index + 1) * 64]
+        assert verify_proof("md5", leaf, tree.proof(index), tree.root)
+        assert not verify_proof("md5", leaf + b"x", tree.proof(index), tree.root)
+
+    assert tree.verify_range(data[128:640], 128)
+    assert not tree.verify_range(b"x" + data[129:640], 128)
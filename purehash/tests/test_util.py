@@ -1,7 +1,7 @@
 from random import getrandbits
 import struct
 
-from purehash._util import pack, unpack
+from purehash._util import BACKENDS
 
 
 SIZE_MAP = {
@@ -15,16 +15,32 @@ LITTLE_ENDIAN_MAP = {True: "<", False: ">"}
 
 
 def test_pack_unpack():
-    for size in (1, 2, 4, 8):
+    for pack_, unpack_ in BACKENDS.values():
+        for size in (1, 2, 4, 8):
+            for little_endian in (True, False):
+                for len_numbers in range(1, 5):
+                    numbers = tuple(getrandbits(size * 8) for _ in range(len_numbers))
+                    struct_format = LITTLE_ENDIAN_MAP[little_endian] + (
+                        SIZE_MAP[size] * len_numbers
+                    )
+
+                    packed = pack_(size, little_endian, *numbers)
+                    assert packed == struct.pack(struct_format, *numbers)
+
+                    unpacked = unpack_(size, little_endian, packed)
+                    assert unpacked == struct.unpack(struct_format, packed)
+
+
+def test_backends():
+    reference_pack, reference_unpack = BACKENDS["pure"]
+
+    for size in (1, 2, 4, 8, 16):
         for little_endian in (True, False):
-            for len_numbers in range(1, 5):
+            for len_numbers in (1, 16):
                 numbers = tuple(getrandbits(size * 8) for _ in range(len_numbers))
-                struct_format = LITTLE_ENDIAN_MAP[little_endian] + (
-                    SIZE_MAP[size] * len_numbers
-                )
-
-                packed = pack(size, little_endian, *numbers)
-                assert packed == struct.pack(struct_format, *numbers)
+                packed = reference_pack(size, little_endian, *numbers)
 
-                unpacked = unpack(size, little_endian, packed)
-                assert unpacked == struct.unpack(struct_format, packed)
+                for pack_, unpack_ in BACKENDS.values():
+                    assert pack_(size, little_endian, *numbers) == packed
+                    assert unpack_(size, little_endian, packed) == numbers
+                    assert unpack_(size, little_endian, memoryview(packed)) == numbers
@@ -0,0 +1,310 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import os
+from typing import Iterable, Union
+
+from purehash._common import Hash, hash_many
+from purehash._file import PathLike
+from purehash._registry import lookup, name_of
+from purehash._util import ReadableBuffer, pack, unpack
+
+DEFAULT_LEAF_SIZE: int = 2**20
+
+# Leaves and nodes are hashed with different prefixes, so that a node can never
+# be passed off as a leaf (RFC 6962).
+LEAF_PREFIX: bytes = b"\x00"
+NODE_PREFIX: bytes = b"\x01"
+
+INDEX_MAGIC: bytes = b"PHMT"
+
+
+def hash_leaf(algorithm: type[Hash], leaf: ReadableBuffer) -> bytes:
+    hash_: Hash = algorithm(LEAF_PREFIX)
+    hash_.update(leaf)
+
+    return hash_.digest()
+
+
+def _hash_file_leaf(
+    path: str, algorithm: type[Hash], leaf_size: int, index: int
+) -> bytes:
+    with open(path, "rb") as file:
+        file.seek(index * leaf_size)
+        return hash_leaf(algorithm, file.read(leaf_size))
+
+
+def _hash_node(algorithm: type[Hash], left: bytes, right: bytes) -> bytes:
+    return algorithm(NODE_PREFIX + left + right).digest()
+
+
+def _hash_level(algorithm: type[Hash], level: list[bytes]) -> list[bytes]:
+    # An odd node out is promoted to the next level unchanged.
+    parents: list[bytes] = hash_many(
+        algorithm,
+        (NODE_PREFIX + level[i] + level[i + 1] for i in range(0, len(level) - 1, 2)),
+    )
+    if len(level) % 2:
+        parents.append(level[-1])
+
+    return parents
+
+
+def _leaf_count(size: int, leaf_size: int) -> int:
+    # Empty data still has a single (empty) leaf.
+    return max(1, -(-size // leaf_size))
+
+
+class MerkleTree:
+    algorithm: type[Hash]
+    leaf_size: int
+    size: int
+    _levels: list[list[bytes]]
+
+    def __init__(
+        self,
+        leaves: Iterable[bytes],
+        size: int,
+        algorithm: Union[str, type[Hash]] = "sha256",
+        leaf_size: int = DEFAULT_LEAF_SIZE,
+    ) -> None:
+        assert leaf_size > 0, "leaf_size must be positive."
+
+        self.algorithm = lookup(algorithm, fixed_size=True)
+        self.leaf_size = leaf_size
+        self.size = size
+        self._levels = [list(leaves)]
+
+        if len(self._levels[0]) != _leaf_count(size, leaf_size):
+            raise ValueError("Leaf count does not match size.")
+
+        self._build()
+
+    def _build(self) -> None:
+        del self._levels[1:]
+
+        while len(self._levels[-1]) > 1:
+            self._levels.append(_hash_level(self.algorithm, self._levels[-1]))
+
+    @classmethod
+    def from_data(
+        cls,
+        data: ReadableBuffer,
+        algorithm: Union[str, type[Hash]] = "sha256",
+        leaf_size: int = DEFAULT_LEAF_SIZE,
+        workers: int = 1,
+    ) -> MerkleTree:
+        algorithm_: type[Hash] = lookup(algorithm, fixed_size=True)
+        view: memoryview = memoryview(data).cast("B")
+        leaves: list[ReadableBuffer] = [
+            view[i * leaf_size : (i + 1) * leaf_size]
+            for i in range(_leaf_count(len(view), leaf_size))
+        ]
+
+        digests: list[bytes]
+        if workers > 1 and len(leaves) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                digests = list(
+                    executor.map(hash_leaf, repeat(algorithm_), map(bytes, leaves))
+                )
+        else:
+            digests = [hash_leaf(algorithm_, leaf) for leaf in leaves]
+
+        return cls(digests, len(view), algorithm_, leaf_size)
+
+    @classmethod
+    def from_file(
+        cls,
+        path: PathLike,
+        algorithm: Union[str, type[Hash]] = "sha256",
+        leaf_size: int = DEFAULT_LEAF_SIZE,
+        workers: int = 1,
+    ) -> MerkleTree:
+        algorithm_: type[Hash] = lookup(algorithm, fixed_size=True)
+        path = os.fspath(path)
+        size: int = os.path.getsize(path)
+        indices: range = range(_leaf_count(size, leaf_size))
+        arguments: tuple[repeat, ...] = (
+            repeat(path),
+            repeat(algorithm_),
+            repeat(leaf_size),
+        )
+
+        # Workers read their own leaves, rather than having them pickled across.
+        digests: list[bytes]
+        if workers > 1 and len(indices) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                digests = list(executor.map(_hash_file_leaf, *arguments, indices))
+        else:
+            digests = list(map(_hash_file_leaf, *arguments, indices))
+
+        return cls(digests, size, algorithm_, leaf_size)
+
+    @property
+    def leaves(self) -> list[bytes]:
+        return list(self._levels[0])
+
+    @property
+    def root(self) -> bytes:
+        return self._levels[-1][0]
+
+    def hexroot(self) -> str:
+        return self.root.hex()
+
+    def update(self, data: ReadableBuffer, start: int, end: int) -> None:
+        # data is the whole object after modification, of which only [start, end)
+        # changed. Only the leaves covering that range, and their paths, are rehashed.
+        view: memoryview = memoryview(data).cast("B")
+        leaf_size: int = self.leaf_size
+        leaves: list[bytes] = self._levels[0]
+
+        assert 0 <= start <= end, "Invalid range."
+
+        count: int = _leaf_count(len(view), leaf_size)
+        resized: bool = count != len(leaves) or len(view) != self.size
+        if resized:
+            # A change in size moves the final leaf, so rehash through to the end.
+            end = len(view)
+            del leaves[count:]
+            leaves += [b""] * (count - len(leaves))
+            self.size = len(view)
+
+        dirty: set[int] = set(
+            range(start // leaf_size, min(count, -(-end // leaf_size)))
+        )
+        if resized:
+            dirty.add(count - 1)
+
+        i: int
+        for i in dirty:
+            leaves[i] = hash_leaf(
+                self.algorithm, view[i * leaf_size : (i + 1) * leaf_size]
+            )
+
+        if resized:
+            self._build()
+            return
+
+        # Recompute only the parents of dirty nodes, level by level.
+        level: list[bytes]
+        for level, parents in zip(self._levels, self._levels[1:]):
+            dirty = {i // 2 for i in dirty}
+
+            for i in dirty:
+                if 2 * i + 1 < len(level):
+                    parents[i] = _hash_node(
+                        self.algorithm, level[2 * i], level[2 * i + 1]
+                    )
+                else:
+                    parents[i] = level[2 * i]
+
+    def proof(self, index: int) -> list[tuple[bool, bytes]]:
+        # Sibling digests from leaf to root, each flagged with whether it is on the
+        # left. Levels where the node was promoted without a sibling are skipped.
+        assert 0 <= index < len(self._levels[0]), "Leaf index out of range."
+
+        path: list[tuple[bool, bytes]] = []
+
+        level: list[bytes]
+        for level in self._levels[:-1]:
+            sibling: int = index ^ 1
+            if sibling < len(level):
+                path.append((sibling < index, level[sibling]))
+
+            index //= 2
+
+        return path
+
+    def verify_range(self, data: ReadableBuffer, offset: int) -> bool:
+        # Check leaf-aligned data at offset against the stored leaf digests.
+        view: memoryview = memoryview(data).cast("B")
+        leaf_size: int = self.leaf_size
+
+        assert offset % leaf_size == 0, "offset must be leaf aligned."
+
+        first: int = offset // leaf_size
+        last: int = first + _leaf_count(len(view), leaf_size)
+        if last > len(self._levels[0]):
+            return False
+
+        i: int
+        for i in range(first, last):
+            leaf: memoryview = view[(i - first) * leaf_size :][:leaf_size]
+            if hash_leaf(self.algorithm, leaf) != self._levels[0][i]:
+                return False
+
+        return True
+
+    def save(self, path: PathLike) -> None:
+        name: bytes = name_of(self.algorithm).encode()
+
+        with open(path, "wb") as file:
+            file.write(INDEX_MAGIC)
+            file.write(pack(1, False, len(name)) + name)
+            file.write(pack(8, False, self.leaf_size, self.size))
+            file.write(b"".join(self._levels[0]))
+
+    @classmethod
+    def load(cls, path: PathLike) -> MerkleTree:
+        with open(path, "rb") as file:
+            data: bytes = file.read()
+
+        # The index is external input, so is validated rather than asserted.
+        if len(data) < 5 or data[:4] != INDEX_MAGIC:
+            raise ValueError("Not a Merkle tree index.")
+
+        offset: int = 5 + data[4]
+        if len(data) < offset + 16:
+            raise ValueError("Truncated Merkle tree index header.")
+
+        name: str = data[5:offset].decode()
+        leaf_size: int
+        size: int
+        leaf_size, size = unpack(8, False, data[offset : offset + 16])
+        offset += 16
+
+        if not leaf_size:
+            raise ValueError("leaf_size must be positive.")
+
+        algorithm: type[Hash] = lookup(name, fixed_size=True)
+        digest_size: int = algorithm._digest_size
+
+        if (len(data) - offset) % digest_size:
+            raise ValueError("Truncated Merkle tree index leaves.")
+
+        return cls(
+            (data[i : i + digest_size] for i in range(offset, len(data), digest_size)),
+            size,
+            algorithm,
+            leaf_size,
+        )
+
+
+def verify_proof(
+    algorithm: Union[str, type[Hash]],
+    leaf: ReadableBuffer,
+    proof: list[tuple[bool, bytes]],
+    root: bytes,
+) -> bool:
+    algorithm_: type[Hash] = lookup(algorithm, fixed_size=True)
+    digest: bytes = hash_leaf(algorithm_, leaf)
+
+    left: bool
+    sibling: bytes
+    for left, sibling in proof:
+        digest = (
+            _hash_node(algorithm_, sibling, digest)
+            if left
+            else _hash_node(algorithm_, digest, sibling)
+        )
+
+    return digest == root
+
+
+def merkle_root(
+    data: ReadableBuffer,
+    algorithm: Union[str, type[Hash]] = "sha256",
+    leaf_size: int = DEFAULT_LEAF_SIZE,
+    workers: int = 1,
+) -> bytes:
+    return MerkleTree.from_data(data, algorithm, leaf_size, workers).root
@@ -25,8 +25,10 @@ setup(
     keywords="hash, cryptography",
     packages=find_packages(),
     python_requires=">=3.7, <4",
+    entry_points={"console_scripts": ["purehash=purehash.cli:main"]},
     extras_require={
         "dev": ["pre-commit", "black", "mypy", "twine"],
         "test": ["pytest"],
+        "numpy": ["numpy"],
     },
 )